@@ -15,62 +15,78 @@ Usage:
     from hardware import LEDColor, DeviceStatus
 """
 
-# Legacy components (backward compatibility)
-from .led_controller import LEDController
-from .sensor_reader import SensorReader
-from .sensor_monitor import SensorMonitor
+import importlib
 
-# HAL components (new interface)
-from .hal_core import (
-    IHALDevice, IHALSensor, IHALIndicator,
-    DeviceStatus, DeviceType,
-    HALError, DeviceNotInitializedError, 
-    DeviceOperationError, DeviceConfigError,
-    HALManager, get_hal_manager, initialize_hal, cleanup_hal
-)
+# Public name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562) so `import hardware` stays cheap on the Pi and
+# does not pull in RPi.GPIO / adafruit_dht until a component is used.
+_LAZY_ATTRS = {
+    # Legacy components (backward compatibility)
+    'LEDController': '.led_controller',
+    'SensorReader': '.sensor_reader',
+    'SensorMonitor': '.sensor_monitor',
 
-from .hal_sensors import (
-    DHT11Sensor, SensorManager, create_dht11_sensor
-)
+    # HAL core
+    'IHALDevice': '.hal_core',
+    'IHALSensor': '.hal_core',
+    'IHALIndicator': '.hal_core',
+    'DeviceStatus': '.hal_core',
+    'DeviceType': '.hal_core',
+    'HALError': '.hal_core',
+    'DeviceNotInitializedError': '.hal_core',
+    'DeviceOperationError': '.hal_core',
+    'DeviceConfigError': '.hal_core',
+    'HALManager': '.hal_core',
+    'get_hal_manager': '.hal_core',
+    'initialize_hal': '.hal_core',
+    'cleanup_hal': '.hal_core',
+
+    # HAL sensors
+    'DHT11Sensor': '.hal_sensors',
+    'SensorManager': '.hal_sensors',
+    'create_dht11_sensor': '.hal_sensors',
+    'get_sensor_manager': '.hal_sensors',
+
+    # HAL indicators
+    'RGBLEDIndicator': '.hal_indicators',
+    'IndicatorManager': '.hal_indicators',
+    'get_indicator_manager': '.hal_indicators',
+    'LEDColor': '.hal_indicators',
+    'LEDState': '.hal_indicators',
+    'create_rgb_led': '.hal_indicators',
 
-from .hal_indicators import (
-    RGBLEDIndicator, IndicatorManager, LEDColor, LEDState, create_rgb_led
-)
+    # HAL interface
+    'TrustMonitorHAL': '.hal_interface',
+    'get_hal': '.hal_interface',
+    'initialize_hardware': '.hal_interface',
+    'cleanup_hardware': '.hal_interface',
+
+    # Backward compatibility functions
+    'read_sensor_values': '.hal_interface',
+    'set_led_color': '.hal_interface',
+    'blink_led_color': '.hal_interface',
+    'turn_off_led': '.hal_interface',
+    'get_device_statuses': '.hal_interface',
+}
 
-from .hal_interface import (
-    TrustMonitorHAL, get_hal, initialize_hardware, cleanup_hardware,
-    read_sensor_values, set_led_color, blink_led_color, 
-    turn_off_led, get_device_statuses
-)
+def __getattr__(name):
+    """Import the defining submodule on first access to a public name"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 # Version information
 __version__ = '2.2.6'
 __hal_version__ = '2.2.6'
 
-__all__ = [
-    # Legacy components
-    'LEDController', 'SensorReader', 'SensorMonitor',
-    
-    # HAL core
-    'IHALDevice', 'IHALSensor', 'IHALIndicator',
-    'DeviceStatus', 'DeviceType',
-    'HALError', 'DeviceNotInitializedError', 
-    'DeviceOperationError', 'DeviceConfigError',
-    'HALManager', 'get_hal_manager', 'initialize_hal', 'cleanup_hal',
-    
-    # HAL sensors
-    'DHT11Sensor', 'SensorManager', 'create_dht11_sensor',
-    
-    # HAL indicators
-    'RGBLEDIndicator', 'IndicatorManager', 'LEDColor', 'LEDState', 'create_rgb_led',
-    
-    # HAL interface
-    'TrustMonitorHAL', 'get_hal', 'initialize_hardware', 'cleanup_hardware',
-    
-    # Backward compatibility functions
-    'read_sensor_values', 'set_led_color', 'blink_led_color', 
-    'turn_off_led', 'get_device_statuses'
-]
+# Each public name is declared exactly once, in _LAZY_ATTRS
+__all__ = list(_LAZY_ATTRS)
 
 def get_hardware_info():
     """Get hardware module information"""
@@ -15,23 +15,70 @@ Features:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, Iterable, List, Callable
 from enum import Enum
+from types import MappingProxyType
 import logging
+import sys
 import time
-from datetime import datetime
 
 # Configure HAL logging
 hal_logger = logging.getLogger('TrustMonitor.HAL')
 hal_logger.setLevel(logging.INFO)
+manager_logger = logging.getLogger('TrustMonitor.HAL.Manager')
 
-class DeviceStatus(Enum):
-    """Device status enumeration"""
+# Above this many devices, per-device success lines collapse into the summary
+PER_DEVICE_LOG_LIMIT = 8
+
+# Shared read-only config for devices without an entry in the global config
+_EMPTY_CONFIG = MappingProxyType({})
+
+# Upper bound on worker threads for concurrent device lifecycle operations
+MAX_PARALLEL_DEVICES = 8
+
+CONSOLE_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+class ConsoleFormatter(logging.Formatter):
+    """'[timestamp] message' formatter that formats each wall-clock second only once"""
+    
+    def __init__(self):
+        super().__init__('[%(asctime)s] %(message)s', CONSOLE_TIME_FORMAT)
+        self._cached_second = None
+        self._cached_time = ''
+        
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(datefmt or CONSOLE_TIME_FORMAT, self.converter(second))
+            self._cached_second = second
+        return self._cached_time
+
+def get_console_logger(name: str) -> logging.Logger:
+    """Get a logger that prints timestamped status lines to stdout"""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(ConsoleFormatter())
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+class DeviceStatus(str, Enum):
+    """Device status enumeration
+    
+    The str mixin keeps .value the status string ('ready', ...) while status
+    checks compare as plain str equality.
+    """
     UNINITIALIZED = 'uninitialized'
     INITIALIZED = 'initialized'
     READY = 'ready'
     ERROR = 'error'
     DISABLED = 'disabled'
+    
+    # Keep 'DeviceStatus.READY' in messages on every Python version
+    __str__ = Enum.__str__
 
 class DeviceType(Enum):
     """Device type enumeration"""
@@ -56,16 +103,41 @@ class DeviceConfigError(HALError):
     """Device configuration exception"""
     pass
 
+class DeviceLoggerAdapter(logging.LoggerAdapter):
+    """Tags records on the shared HAL logger with the originating device ID"""
+    
+    def process(self, msg, kwargs):
+        msg, kwargs = super().process(msg, kwargs)
+        return f"[{self.extra['device']}] {msg}", kwargs
+
 class IHALDevice(ABC):
     """Base interface for all HAL devices"""
     
+    # Fixed attribute layout; subclasses declare their own __slots__
+    __slots__ = ('_manager', '_status', 'device_id', 'device_type', 'config', 'last_error', 'logger')
+    
     def __init__(self, device_id: str, device_type: DeviceType):
+        self._manager = None  # Owning HALManager, set on registration
+        self._status = DeviceStatus.UNINITIALIZED
         self.device_id = device_id
         self.device_type = device_type
-        self.status = DeviceStatus.UNINITIALIZED
         self.config = {}
         self.last_error = None
-        self.logger = logging.getLogger(f'TrustMonitor.HAL.{device_id}')
+        # Adapter over the shared HAL logger; avoids a logger registry entry per device
+        self.logger = DeviceLoggerAdapter(hal_logger, {'device': device_id})
+        
+    @property
+    def status(self) -> DeviceStatus:
+        """Current device status"""
+        return self._status
+        
+    @status.setter
+    def status(self, value: DeviceStatus) -> None:
+        # Invalidate the owning manager's status cache only on real changes
+        if value is not self._status:
+            self._status = value
+            if self._manager is not None:
+                self._manager._status_dirty = True
         
     @abstractmethod
     def initialize(self, config: Dict[str, Any] = None) -> bool:
@@ -90,6 +162,8 @@ class IHALDevice(ABC):
     def set_config(self, config: Dict[str, Any]) -> None:
         """Set device configuration"""
         self.config.update(config)
+        if self._manager is not None:
+            self._manager._info_cache.pop(self.device_id, None)
         
     def get_config(self, key: str = None) -> Any:
         """Get device configuration"""
@@ -106,6 +180,8 @@ class IHALDevice(ABC):
 class IHALSensor(IHALDevice):
     """Interface for sensor devices"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def read_value(self, sensor_type: str) -> Optional[float]:
         """Read sensor value"""
@@ -120,10 +196,19 @@ class IHALSensor(IHALDevice):
     def get_unit(self, sensor_type: str) -> str:
         """Get sensor unit"""
         pass
+        
+    def is_stale(self) -> bool:
+        """Whether the sensor appears stuck repeating the same reading"""
+        return False
 
 class IHALIndicator(IHALDevice):
     """Interface for indicator devices (LEDs, displays)"""
     
+    __slots__ = ()
+    
+    # True when set_state('on', color=...) can switch colors directly, without clearing first
+    supports_atomic_color = False
+    
     @abstractmethod
     def set_state(self, state: str, **kwargs) -> bool:
         """Set indicator state"""
@@ -144,8 +229,19 @@ class HALManager:
     
     def __init__(self):
         self.devices: Dict[str, IHALDevice] = {}
-        self.logger = logging.getLogger('TrustMonitor.HAL.Manager')
+        self.logger = manager_logger
         self.initialized = False
+        # get_all_status() result, rebuilt only after a device status change
+        self._status_cache: Dict[str, DeviceStatus] = {}
+        self._status_dirty = True
+        # Static list_devices() fields (type, config) per device
+        self._info_cache: Dict[str, Dict[str, Any]] = {}
+        
+    def _attach(self, device: IHALDevice) -> None:
+        """Take ownership of a device and invalidate cached views"""
+        device._manager = self
+        self._info_cache.pop(device.device_id, None)
+        self._status_dirty = True
         
     def register_device(self, device: IHALDevice) -> bool:
         """Register a device with HAL"""
@@ -154,6 +250,7 @@ class HALManager:
                 self.logger.warning(f"Device {device.device_id} already registered, replacing")
                 
             self.devices[device.device_id] = device
+            self._attach(device)
             self.logger.info(f"Device {device.device_id} registered successfully")
             return True
             
@@ -161,6 +258,29 @@ class HALManager:
             self.logger.error(f"Failed to register device {device.device_id}: {e}")
             return False
             
+    def register_devices(self, devices: Iterable[IHALDevice]) -> bool:
+        """Register several devices with HAL in one batch"""
+        try:
+            batch = {}
+            for device in devices:
+                if not isinstance(device, IHALDevice):
+                    raise DeviceConfigError(f"Not a HAL device: {device!r}")
+                batch[device.device_id] = device
+                
+            replaced = [device_id for device_id in batch if device_id in self.devices]
+            if replaced:
+                self.logger.warning("Devices already registered, replacing: %s", ', '.join(replaced))
+                
+            self.devices.update(batch)
+            for device in batch.values():
+                self._attach(device)
+            self.logger.info("Registered %d devices: %s", len(batch), ', '.join(batch))
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to register devices: {e}")
+            return False
+            
     def unregister_device(self, device_id: str) -> bool:
         """Unregister a device from HAL"""
         try:
@@ -168,6 +288,9 @@ class HALManager:
                 device = self.devices[device_id]
                 device.cleanup()
                 del self.devices[device_id]
+                device._manager = None
+                self._info_cache.pop(device_id, None)
+                self._status_dirty = True
                 self.logger.info(f"Device {device_id} unregistered successfully")
                 return True
             else:
@@ -182,29 +305,49 @@ class HALManager:
         """Get device by ID"""
         return self.devices.get(device_id)
         
+    def _run_parallel(self, func: Callable, items: Tuple[Tuple[str, IHALDevice], ...]) -> List[Any]:
+        """Apply func to each (device_id, device) item concurrently, preserving order"""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+            
+        workers = min(MAX_PARALLEL_DEVICES, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='TrustMonitor-HAL') as executor:
+            return list(executor.map(func, items))
+            
     def initialize_all(self, global_config: Dict[str, Any] = None) -> bool:
         """Initialize all registered devices"""
         try:
             self.logger.info("Initializing all HAL devices...")
             
-            success_count = 0
-            total_count = len(self.devices)
+            items = tuple(self.devices.items())
+            total_count = len(items)
+            log_each = total_count <= PER_DEVICE_LOG_LIMIT
             
-            for device_id, device in self.devices.items():
+            # Resolve each device's config once, up front
+            if global_config:
+                configs = {device_id: global_config.get(device_id, _EMPTY_CONFIG) for device_id, _ in items}
+            else:
+                configs = {}
+                
+            def initialize_one(item: Tuple[str, IHALDevice]) -> Optional[str]:
+                device_id, device = item
                 try:
-                    device_config = global_config.get(device_id, {}) if global_config else {}
-                    if device.initialize(device_config):
-                        success_count += 1
-                        self.logger.info(f"Device {device_id} initialized successfully")
-                    else:
-                        self.logger.error(f"Device {device_id} initialization failed")
-                        
+                    if not device.initialize(configs.get(device_id, _EMPTY_CONFIG)):
+                        return "initialization failed"
+                    if log_each:
+                        self.logger.info("Device %s initialized successfully", device_id)
+                    return None
                 except Exception as e:
-                    self.logger.error(f"Device {device_id} initialization error: {e}")
                     device.set_error(e)
+                    return f"initialization error: {e}"
                     
+            errors = self._collect_errors(items, self._run_parallel(initialize_one, items))
+            success_count = total_count - len(errors)
+            if errors:
+                self.logger.error("HAL device initialization failures: %s", '; '.join(errors))
+                
             self.initialized = success_count == total_count
-            self.logger.info(f"HAL initialization complete: {success_count}/{total_count} devices ready")
+            self.logger.info("HAL initialization complete: %d/%d devices ready", success_count, total_count)
             
             return self.initialized
             
@@ -217,22 +360,28 @@ class HALManager:
         try:
             self.logger.info("Cleaning up all HAL devices...")
             
-            success_count = 0
-            total_count = len(self.devices)
+            items = tuple(self.devices.items())
+            total_count = len(items)
+            log_each = total_count <= PER_DEVICE_LOG_LIMIT
             
-            for device_id, device in self.devices.items():
+            def cleanup_one(item: Tuple[str, IHALDevice]) -> Optional[str]:
+                device_id, device = item
                 try:
-                    if device.cleanup():
-                        success_count += 1
-                        self.logger.info(f"Device {device_id} cleanup successful")
-                    else:
-                        self.logger.warning(f"Device {device_id} cleanup failed")
-                        
+                    if not device.cleanup():
+                        return "cleanup failed"
+                    if log_each:
+                        self.logger.info("Device %s cleanup successful", device_id)
+                    return None
                 except Exception as e:
-                    self.logger.error(f"Device {device_id} cleanup error: {e}")
+                    return f"cleanup error: {e}"
                     
+            errors = self._collect_errors(items, self._run_parallel(cleanup_one, items))
+            success_count = total_count - len(errors)
+            if errors:
+                self.logger.warning("HAL device cleanup failures: %s", '; '.join(errors))
+                
             self.initialized = False
-            self.logger.info(f"HAL cleanup complete: {success_count}/{total_count} devices cleaned up")
+            self.logger.info("HAL cleanup complete: %d/%d devices cleaned up", success_count, total_count)
             
             return True
             
@@ -240,58 +389,80 @@ class HALManager:
             self.logger.error(f"HAL cleanup failed: {e}")
             return False
             
+    @staticmethod
+    def _collect_errors(items: Tuple[Tuple[str, IHALDevice], ...], results: List[Optional[str]]) -> List[str]:
+        """Pair per-device error messages with their device IDs"""
+        return [f"{device_id} ({error})" for (device_id, _), error in zip(items, results) if error]
+        
     def get_device_status(self, device_id: str) -> Optional[DeviceStatus]:
         """Get device status"""
-        device = self.get_device(device_id)
-        return device.get_status() if device else None
+        device = self.devices.get(device_id)
+        return device.status if device is not None else None
         
     def get_all_status(self) -> Dict[str, DeviceStatus]:
         """Get all device statuses"""
-        return {device_id: device.get_status() for device_id, device in self.devices.items()}
+        if self._status_dirty:
+            # Clear the flag first so a change during the rebuild marks it dirty again
+            self._status_dirty = False
+            self._status_cache = {device_id: device.get_status() for device_id, device in self.devices.items()}
+        return self._status_cache.copy()
         
     def run_self_tests(self) -> Dict[str, bool]:
         """Run self-tests on all devices"""
-        results = {}
+        items = tuple(self.devices.items())
+        log_each = len(items) <= PER_DEVICE_LOG_LIMIT
         
-        for device_id, device in self.devices.items():
+        def self_test_one(item: Tuple[str, IHALDevice]) -> Optional[str]:
+            device_id, device = item
             try:
-                results[device_id] = device.self_test()
-                if results[device_id]:
-                    self.logger.info(f"Device {device_id} self-test passed")
-                else:
-                    self.logger.warning(f"Device {device_id} self-test failed")
-                    
+                if not device.self_test():
+                    return "self-test failed"
+                if log_each:
+                    self.logger.info("Device %s self-test passed", device_id)
+                return None
             except Exception as e:
-                self.logger.error(f"Device {device_id} self-test error: {e}")
-                results[device_id] = False
+                return f"self-test error: {e}"
                 
-        return results
+        outcomes = self._run_parallel(self_test_one, items)
+        errors = self._collect_errors(items, outcomes)
+        if errors:
+            self.logger.warning("HAL device self-test failures: %s", '; '.join(errors))
+            
+        return {device_id: error is None for (device_id, _), error in zip(items, outcomes)}
         
     def list_devices(self) -> Dict[str, Dict[str, Any]]:
         """List all registered devices with their info"""
         device_info = {}
         
         for device_id, device in self.devices.items():
+            static_info = self._info_cache.get(device_id)
+            if static_info is None:
+                static_info = {'type': device.device_type.value, 'config': device.get_config()}
+                self._info_cache[device_id] = static_info
+                
             device_info[device_id] = {
-                'type': device.device_type.value,
+                'type': static_info['type'],
                 'status': device.status.value,
-                'config': device.get_config(),
+                'config': static_info['config'].copy(),
                 'last_error': str(device.last_error) if device.last_error else None
             }
             
         return device_info
 
-# Global HAL Manager instance
-hal_manager = HALManager()
+# Global HAL Manager instance, created on first use
+_hal_manager = None
 
 def get_hal_manager() -> HALManager:
     """Get global HAL manager instance"""
-    return hal_manager
+    global _hal_manager
+    if _hal_manager is None:
+        _hal_manager = HALManager()
+    return _hal_manager
 
 def initialize_hal(global_config: Dict[str, Any] = None) -> bool:
     """Initialize HAL system"""
-    return hal_manager.initialize_all(global_config)
+    return get_hal_manager().initialize_all(global_config)
 
 def cleanup_hal() -> bool:
     """Cleanup HAL system"""
-    return hal_manager.cleanup_all()
+    return get_hal_manager().cleanup_all()
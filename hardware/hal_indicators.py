@@ -15,22 +15,26 @@ Features:
 """
 
 from typing import Dict, Any, Optional, List
+from collections import deque
+import threading
 import time
 import logging
-from datetime import datetime
 from enum import Enum
 
+# RPi.GPIO is imported on first LED initialization (see _load_gpio) so that
+# importing this module stays cheap and quiet on non-Pi hosts
+GPIO = None
+GPIO_AVAILABLE = False
+_gpio_import_attempted = False
+
 try:
-    import RPi.GPIO as GPIO
-    GPIO_AVAILABLE = True
+    from .hal_core import IHALIndicator, DeviceStatus, DeviceType, HALError, DeviceOperationError
 except ImportError:
-    GPIO_AVAILABLE = False
-    print("WARNING: RPi.GPIO not available, LED will run in simulation mode")
-
-from hal_core import IHALIndicator, DeviceStatus, DeviceType, HALError, DeviceOperationError
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_core import IHALIndicator, DeviceStatus, DeviceType, HALError, DeviceOperationError
 
-class LEDColor(Enum):
-    """Standard LED colors"""
+class LEDColor(str, Enum):
+    """Standard LED colors (str-valued, so .value is the color string)"""
     RED = 'red'
     GREEN = 'green'
     BLUE = 'blue'
@@ -39,22 +43,164 @@ class LEDColor(Enum):
     MAGENTA = 'magenta'
     WHITE = 'white'
     OFF = 'off'
+    
+    __str__ = Enum.__str__
 
-class LEDState(Enum):
-    """LED state enumeration"""
+class LEDState(str, Enum):
+    """LED state enumeration (str-valued, so .value is the state string)"""
     OFF = 'off'
     ON = 'on'
     BLINKING = 'blinking'
     BREATHING = 'breathing'
     ERROR = 'error'
+    
+    __str__ = Enum.__str__
+
+indicator_manager_logger = logging.getLogger('TrustMonitor.HAL.IndicatorManager')
+
+# String -> member lookup tables for set_state() (keys are the member values)
+_LED_STATE_BY_STR = {member.value: member for member in LEDState}
+_LED_COLOR_BY_STR = {member.value: member for member in LEDColor}
+
+def _lookup_member(enum_type: type, table: Dict[str, Any], name: Any, kind: str) -> Any:
+    """Resolve a state/color member or string; exact lowercase hit first, then case-folded"""
+    if isinstance(name, enum_type):
+        return name
+    if not isinstance(name, str):
+        raise ValueError(f"Unsupported {kind}: {name!r}")
+    member = table.get(name)
+    if member is None:
+        member = table.get(name.lower())
+        if member is None:
+            raise ValueError(f"Unsupported {kind}: {name}")
+    return member
+
+def _noop_set_color(color: 'LEDColor', brightness: int) -> None:
+    """PWM writer used while no PWM channels are bound (simulation/cleanup)"""
+    
+def _load_gpio() -> bool:
+    """Import RPi.GPIO once; returns whether it is available"""
+    global GPIO, GPIO_AVAILABLE, _gpio_import_attempted
+    if not _gpio_import_attempted:
+        _gpio_import_attempted = True
+        try:
+            import RPi.GPIO as gpio_module
+            GPIO = gpio_module
+            GPIO_AVAILABLE = True
+        except ImportError:
+            GPIO_AVAILABLE = False
+    return GPIO_AVAILABLE
+
+# One pigpio daemon connection shared by every LED user in the process
+_pigpio_pi = None
+_pigpio_users = 0
+_pigpio_lock = threading.Lock()
+
+def acquire_pigpio():
+    """Get the shared pigpio daemon connection; returns None if pigpio is unusable"""
+    global _pigpio_pi, _pigpio_users
+    with _pigpio_lock:
+        if _pigpio_pi is None:
+            try:
+                import pigpio
+            except ImportError:
+                return None
+            pi = pigpio.pi()
+            if not pi.connected:
+                return None
+            _pigpio_pi = pi
+        _pigpio_users += 1
+        return _pigpio_pi
+
+def release_pigpio():
+    """Release a connection from acquire_pigpio; the last user closes it"""
+    global _pigpio_pi, _pigpio_users
+    with _pigpio_lock:
+        if _pigpio_users == 0:
+            return
+        _pigpio_users -= 1
+        if _pigpio_users == 0:
+            _pigpio_pi.stop()
+            _pigpio_pi = None
+
+class PigpioPWM:
+    """pigpio-driven PWM channel exposing the RPi.GPIO PWM methods used here"""
+    
+    __slots__ = ('pi', 'pin', 'frequency', 'hardware')
+    
+    # BCM pins routed to the SoC hardware PWM peripheral
+    HARDWARE_PWM_PINS = frozenset((12, 13, 18, 19))
+    
+    def __init__(self, pi, pin: int, frequency: int):
+        self.pi = pi
+        self.pin = pin
+        self.frequency = frequency
+        self.hardware = pin in self.HARDWARE_PWM_PINS
+        if not self.hardware:
+            # DMA-timed PWM from the daemon, with duty expressed in percent
+            pi.set_PWM_frequency(pin, frequency)
+            pi.set_PWM_range(pin, 100)
+            
+    def start(self, duty: float) -> None:
+        self.ChangeDutyCycle(duty)
+        
+    def ChangeDutyCycle(self, duty: float) -> None:
+        if self.hardware:
+            self.pi.hardware_PWM(self.pin, self.frequency, int(duty * 10000))  # 1e6 = 100%
+        else:
+            self.pi.set_PWM_dutycycle(self.pin, int(duty))
+            
+    def stop(self) -> None:
+        self.ChangeDutyCycle(0)
+        
+# PWM channel order used by the color masks
+_CHANNELS = ('red', 'green', 'blue')
+
+# Color -> (red, green, blue) on/off mask, scaled by brightness when applied
+_COLOR_MASKS = {
+    LEDColor.OFF: (0, 0, 0),
+    LEDColor.RED: (1, 0, 0),
+    LEDColor.GREEN: (0, 1, 0),
+    LEDColor.BLUE: (0, 0, 1),
+    LEDColor.YELLOW: (1, 1, 0),
+    LEDColor.CYAN: (0, 1, 1),
+    LEDColor.MAGENTA: (1, 0, 1),
+    LEDColor.WHITE: (1, 1, 1)
+}
 
 class RGBLEDIndicator(IHALIndicator):
     """HAL implementation for RGB LED indicator"""
     
+    __slots__ = (
+        'pins', 'pwm_backend', '_pi', 'pwm_objects', '_r_pwm', '_g_pwm', '_b_pwm', '_channel_pwm', '_all_pwm', '_last_duties',
+        '_fast_set_color',
+        'current_color', 'current_state', 'brightness', 'pwm_frequencies', '_dbg',
+        '_effect', '_effect_steps', '_effect_final_state', '_effect_ok', '_next_t', '_effect_done',
+        '_effect_lock', '_effect_gen'
+    )
+    
+    # set_color rewrites all three channel duties in one call
+    supports_atomic_color = True
+    
+    # Breathing brightness ramp (5% -> 100% -> 5%), computed once at class load
+    _BREATH_RAMP = tuple(list(range(5, 101, 5)) + list(range(100, 0, -5)))
+    
     def __init__(self, device_id: str = "rgb_led"):
         super().__init__(device_id, DeviceType.INDICATOR)
         self.pins = {}
+        self.pwm_backend = None  # 'rpi_gpio', 'pigpio', or None in simulation mode
+        self._pi = None  # pigpio connection when pwm_backend == 'pigpio'
         self.pwm_objects = {}
+        # Direct PWM references bound in initialize() for the hot paths
+        self._r_pwm = None
+        self._g_pwm = None
+        self._b_pwm = None
+        self._channel_pwm = (None, None, None)  # Ordered as _CHANNELS
+        self._all_pwm = ()
+        # Last duty cycle written per channel, so unchanged channels are skipped
+        self._last_duties = [0, 0, 0]
+        # (color, brightness) -> None PWM writer, specialized in initialize()
+        self._fast_set_color = _noop_set_color
         self.current_color = LEDColor.OFF
         self.current_state = LEDState.OFF
         self.brightness = 100
@@ -63,6 +209,23 @@ class RGBLEDIndicator(IHALIndicator):
             'green': 1999,
             'blue': 5000
         }
+        # Cached DEBUG check so hot paths skip building log records
+        self._dbg = self.logger.isEnabledFor(logging.DEBUG)
+        # Non-blocking effect state, advanced by the IndicatorManager ticker.
+        # Each step is (color, brightness, hold seconds).
+        self._effect = None
+        self._effect_steps = deque()
+        self._effect_final_state = LEDState.OFF
+        self._effect_ok = True
+        self._next_t = 0.0
+        self._effect_done = threading.Event()
+        self._effect_done.set()
+        # Serializes PWM writes and effect bookkeeping between callers and the
+        # ticker thread; re-entrant because effect steps call set_color()
+        self._effect_lock = threading.RLock()
+        # Bumped whenever a new effect starts or the LED is cleared, so a
+        # running effect can notice it has been pre-empted
+        self._effect_gen = 0
         
     def initialize(self, config: Dict[str, Any] = None) -> bool:
         """Initialize RGB LED"""
@@ -79,29 +242,30 @@ class RGBLEDIndicator(IHALIndicator):
             }
             self.pwm_frequencies = self.get_config('frequencies') or self.pwm_frequencies
             self.brightness = self.get_config('brightness') or 100
+            self._dbg = self.logger.isEnabledFor(logging.DEBUG)
             
             self.logger.info(f"Initializing RGB LED with pins: {self.pins}")
             
-            if not GPIO_AVAILABLE:
+            backend = self.get_config('pwm_backend') or 'rpi_gpio'
+            if backend == 'pigpio' and self._setup_pigpio():
+                pass
+            elif _load_gpio():
+                if backend == 'pigpio':
+                    self.logger.warning("pigpio daemon not available, falling back to RPi.GPIO PWM")
+                self._setup_rpi_gpio()
+            else:
                 self.logger.warning("RPi.GPIO not available, enabling simulation mode")
                 self.status = DeviceStatus.READY
                 return True
                 
-            # Setup GPIO
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setwarnings(False)
-            
-            # Initialize pins and PWM
-            for color, pin in self.pins.items():
-                GPIO.setup(pin, GPIO.OUT)
-                GPIO.output(pin, GPIO.LOW)
-                
-                # Create PWM object
-                frequency = self.pwm_frequencies.get(color, 1000)
-                pwm = GPIO.PWM(pin, frequency)
-                pwm.start(0)  # Start with 0% duty cycle
-                self.pwm_objects[color] = pwm
-                
+            self._r_pwm = self.pwm_objects.get('red')
+            self._g_pwm = self.pwm_objects.get('green')
+            self._b_pwm = self.pwm_objects.get('blue')
+            self._channel_pwm = (self._r_pwm, self._g_pwm, self._b_pwm)
+            self._all_pwm = tuple(self.pwm_objects.values())
+            self._last_duties = [0, 0, 0]  # PWM started at 0% above
+            self._fast_set_color = self._build_fast_set_color()
+            
             self.status = DeviceStatus.READY
             self.logger.info("RGB LED initialized successfully")
             return True
@@ -114,27 +278,48 @@ class RGBLEDIndicator(IHALIndicator):
     def cleanup(self) -> bool:
         """Clean up LED resources"""
         try:
-            if not GPIO_AVAILABLE:
+            self._finish_effect(False)
+            
+            if self.pwm_backend is None:
                 self.status = DeviceStatus.UNINITIALIZED
                 return True
                 
             # Stop all PWM
-            for pwm in self.pwm_objects.values():
+            for pwm in self._all_pwm:
                 try:
                     pwm.stop()
                 except:
                     pass
                     
-            # Clean up GPIO
-            for pin in self.pins.values():
-                try:
-                    GPIO.setup(pin, GPIO.OUT)
-                    GPIO.output(pin, GPIO.LOW)
-                except:
-                    pass
-                    
-            GPIO.cleanup()
+            if self.pwm_backend == 'pigpio':
+                # Drive pins low and release the daemon connection
+                for pin in self.pins.values():
+                    try:
+                        self._pi.write(pin, 0)
+                    except:
+                        pass
+                release_pigpio()
+                self._pi = None
+            else:
+                # Clean up GPIO
+                for pin in self.pins.values():
+                    try:
+                        GPIO.setup(pin, GPIO.OUT)
+                        GPIO.output(pin, GPIO.LOW)
+                    except:
+                        pass
+                        
+                GPIO.cleanup()
+                
+            self.pwm_backend = None
             self.pwm_objects.clear()
+            self._r_pwm = None
+            self._g_pwm = None
+            self._b_pwm = None
+            self._channel_pwm = (None, None, None)
+            self._all_pwm = ()
+            self._last_duties = [0, 0, 0]
+            self._fast_set_color = _noop_set_color
             self.current_color = LEDColor.OFF
             self.current_state = LEDState.OFF
             self.status = DeviceStatus.UNINITIALIZED
@@ -146,21 +331,42 @@ class RGBLEDIndicator(IHALIndicator):
             self.logger.error(f"RGB LED cleanup failed: {e}")
             return False
             
+    def _setup_rpi_gpio(self) -> None:
+        """Create RPi.GPIO software PWM channels"""
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setwarnings(False)
+        
+        for color, pin in self.pins.items():
+            GPIO.setup(pin, GPIO.OUT)
+            GPIO.output(pin, GPIO.LOW)
+            
+            # Create PWM object
+            frequency = self.pwm_frequencies.get(color, 1000)
+            pwm = GPIO.PWM(pin, frequency)
+            pwm.start(0)  # Start with 0% duty cycle
+            self.pwm_objects[color] = pwm
+            
+        self.pwm_backend = 'rpi_gpio'
+        
+    def _setup_pigpio(self) -> bool:
+        """Create pigpio hardware-timed PWM channels; False if the daemon is unreachable"""
+        pi = acquire_pigpio()
+        if pi is None:
+            return False
+            
+        self._pi = pi
+        for color, pin in self.pins.items():
+            pwm = PigpioPWM(pi, pin, self.pwm_frequencies.get(color, 1000))
+            pwm.start(0)
+            self.pwm_objects[color] = pwm
+            
+        self.pwm_backend = 'pigpio'
+        return True
+        
     def self_test(self) -> bool:
         """Perform LED self-test"""
         try:
-            if self.status != DeviceStatus.READY:
-                return False
-                
-            # Test each color
-            colors = [LEDColor.RED, LEDColor.GREEN, LEDColor.BLUE]
-            for color in colors:
-                if not self.set_color(color, test_mode=True):
-                    return False
-                time.sleep(0.5)
-                
-            # Turn off
-            return self.clear()
+            return self.start_self_test() and self.wait()
             
         except Exception as e:
             self.logger.error(f"RGB LED self-test failed: {e}")
@@ -176,22 +382,22 @@ class RGBLEDIndicator(IHALIndicator):
             if self.status != DeviceStatus.READY:
                 raise DeviceOperationError(f"Device not ready (status: {self.status})")
                 
-            state_enum = LEDState(state.lower())
+            state_enum = _lookup_member(LEDState, _LED_STATE_BY_STR, state, 'state')
             
             if state_enum == LEDState.OFF:
                 return self.clear()
             elif state_enum == LEDState.ON:
-                color = kwargs.get('color', LEDColor.GREEN.value)
-                return self.set_color(LEDColor(color))
+                color = kwargs.get('color', 'green')
+                return self.set_color(_lookup_member(LEDColor, _LED_COLOR_BY_STR, color, 'color'))
             elif state_enum == LEDState.BLINKING:
-                color = kwargs.get('color', LEDColor.GREEN.value)
+                color = kwargs.get('color', 'green')
                 times = kwargs.get('times', 3)
                 speed = kwargs.get('speed', 0.5)
-                return self.blink_color(LEDColor(color), times, speed)
+                return self.blink_color(_lookup_member(LEDColor, _LED_COLOR_BY_STR, color, 'color'), times, speed)
             elif state_enum == LEDState.BREATHING:
-                color = kwargs.get('color', LEDColor.GREEN.value)
+                color = kwargs.get('color', 'green')
                 speed = kwargs.get('speed', 1.0)
-                return self.breath_color(LEDColor(color), speed)
+                return self.breath_color(_lookup_member(LEDColor, _LED_COLOR_BY_STR, color, 'color'), speed)
             else:
                 raise ValueError(f"Unsupported state: {state}")
                 
@@ -209,19 +415,23 @@ class RGBLEDIndicator(IHALIndicator):
             if self.status != DeviceStatus.READY:
                 return False
                 
-            if not GPIO_AVAILABLE:
+            # Clearing cancels any running effect
+            self._cancel_effect()
+            
+            if self.pwm_backend is None:
                 self.current_color = LEDColor.OFF
                 self.current_state = LEDState.OFF
-                self.logger.debug("Simulation mode: LED cleared")
+                if self._dbg:
+                    self.logger.debug("Simulation mode: LED cleared")
                 return True
                 
-            # Set all PWM duty cycles to 0
-            for pwm in self.pwm_objects.values():
-                pwm.ChangeDutyCycle(0)
+            # Zero only the channels that are currently lit
+            self._write_duties((0, 0, 0))
                 
             self.current_color = LEDColor.OFF
             self.current_state = LEDState.OFF
-            self.logger.debug("LED cleared")
+            if self._dbg:
+                self.logger.debug("LED cleared")
             return True
             
         except Exception as e:
@@ -234,50 +444,32 @@ class RGBLEDIndicator(IHALIndicator):
             if self.status != DeviceStatus.READY:
                 return False
                 
+            # A direct color set overrides any running effect, like clear()
+            self._cancel_effect()
+            
             if brightness is None:
                 brightness = self.brightness
                 
-            if not GPIO_AVAILABLE:
+            mask = _COLOR_MASKS.get(color)
+            if mask is None:
+                raise ValueError(f"Unsupported color: {color}")
+                
+            if self.pwm_backend is None:
                 self.current_color = color
                 self.current_state = LEDState.ON if color != LEDColor.OFF else LEDState.OFF
-                if not test_mode:
-                    self.logger.debug(f"Simulation mode: LED color set to {color.value}")
+                if self._dbg and not test_mode:
+                    self.logger.debug("Simulation mode: LED color set to %s", color.value)
                 return True
                 
-            # Clear all colors first
-            for pwm in self.pwm_objects.values():
-                pwm.ChangeDutyCycle(0)
-                
-            # Set specific color
-            if color == LEDColor.OFF:
-                duty_cycles = {'red': 0, 'green': 0, 'blue': 0}
-            elif color == LEDColor.RED:
-                duty_cycles = {'red': brightness, 'green': 0, 'blue': 0}
-            elif color == LEDColor.GREEN:
-                duty_cycles = {'red': 0, 'green': brightness, 'blue': 0}
-            elif color == LEDColor.BLUE:
-                duty_cycles = {'red': 0, 'green': 0, 'blue': brightness}
-            elif color == LEDColor.YELLOW:
-                duty_cycles = {'red': brightness, 'green': brightness, 'blue': 0}
-            elif color == LEDColor.CYAN:
-                duty_cycles = {'red': 0, 'green': brightness, 'blue': brightness}
-            elif color == LEDColor.MAGENTA:
-                duty_cycles = {'red': brightness, 'green': 0, 'blue': brightness}
-            elif color == LEDColor.WHITE:
-                duty_cycles = {'red': brightness, 'green': brightness, 'blue': brightness}
-            else:
-                raise ValueError(f"Unsupported color: {color}")
-                
-            # Apply duty cycles
-            for color_name, duty_cycle in duty_cycles.items():
-                if color_name in self.pwm_objects:
-                    self.pwm_objects[color_name].ChangeDutyCycle(duty_cycle)
+            # Apply duty cycles; channels already at their target are skipped
+            with self._effect_lock:
+                self._fast_set_color(color, brightness)
                     
             self.current_color = color
             self.current_state = LEDState.ON if color != LEDColor.OFF else LEDState.OFF
             
-            if not test_mode:
-                self.logger.debug(f"LED color set to {color.value} (brightness: {brightness}%)")
+            if self._dbg and not test_mode:
+                self.logger.debug("LED color set to %s (brightness: %d%%)", color.value, brightness)
                 
             return True
             
@@ -288,22 +480,11 @@ class RGBLEDIndicator(IHALIndicator):
     def blink_color(self, color: LEDColor, times: int = 3, speed: float = 0.5) -> bool:
         """Blink LED color"""
         try:
-            if self.status != DeviceStatus.READY:
+            if not self.start_blink(color, times, speed) or not self.wait():
                 return False
                 
-            self.logger.debug(f"Blinking {color.value} {times} times at {speed}s intervals")
-            
-            for i in range(times):
-                if not self.set_color(color):
-                    return False
-                time.sleep(speed)
-                if not self.clear():
-                    return False
-                if i < times - 1:  # Don't sleep after last blink
-                    time.sleep(speed)
-                    
-            self.current_state = LEDState.BLINKING
-            self.logger.debug(f"LED blinking completed: {color.value} x{times}")
+            if self._dbg:
+                self.logger.debug("LED blinking completed: %s x%d", color.value, times)
             return True
             
         except Exception as e:
@@ -316,28 +497,181 @@ class RGBLEDIndicator(IHALIndicator):
             if self.status != DeviceStatus.READY:
                 return False
                 
-            self.logger.debug(f"Breathing {color.value} at {speed}s intervals")
-            
-            steps = 20
-            for i in range(steps * 2):
-                if i < steps:
-                    brightness = int((i + 1) * (100 / steps))
-                else:
-                    brightness = int((steps * 2 - i) * (100 / steps))
+            if self._dbg:
+                self.logger.debug("Breathing %s at %ss intervals", color.value, speed)
+            
+            ramp = self._BREATH_RAMP
+            step_delay = speed / len(ramp)
+            
+            # First step goes through set_color, which pre-empts any running
+            # effect and zeroes unused channels
+            if not self.set_color(color, ramp[0], test_mode=True):
+                return False
+            my_gen = self._effect_gen
+            
+            # Remaining steps only touch the channels the color uses
+            for brightness in ramp[1:]:
+                if self._effect_gen != my_gen:
+                    return True  # Pre-empted by a newer effect or clear()
+                time.sleep(step_delay)
+                with self._effect_lock:
+                    if self._effect_gen != my_gen:
+                        return True
+                    self._fast_set_color(color, brightness)
                     
-                if not self.set_color(color, brightness):
-                    return False
-                time.sleep(speed / (steps * 2))
-                
+            if self._effect_gen != my_gen:
+                return True
+            time.sleep(step_delay)
             self.clear()
             self.current_state = LEDState.BREATHING
-            self.logger.debug(f"LED breathing completed: {color.value}")
+            if self._dbg:
+                self.logger.debug("LED breathing completed: %s", color.value)
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to breath LED {color}: {e}")
             return False
             
+    def start_blink(self, color: LEDColor, times: int = 3, speed: float = 0.5) -> bool:
+        """Start blinking LED color and return without waiting for it to finish"""
+        if self.status != DeviceStatus.READY:
+            return False
+            
+        # Nothing to blink; an empty step list would only be reported as a failed effect
+        if times <= 0:
+            return True
+            
+        if self._dbg:
+            self.logger.debug("Blinking %s %d times at %ss intervals", color.value, times, speed)
+        
+        steps = []
+        for i in range(times):
+            steps.append((color, None, speed))
+            # Don't hold after last blink
+            steps.append((LEDColor.OFF, None, speed if i < times - 1 else 0))
+            
+        return self._start_effect('blink', steps, LEDState.BLINKING)
+        
+    def start_self_test(self) -> bool:
+        """Start the red/green/blue self-test sequence without waiting"""
+        if self.status != DeviceStatus.READY:
+            return False
+            
+        steps = [(color, None, 0.5) for color in (LEDColor.RED, LEDColor.GREEN, LEDColor.BLUE)]
+        steps.append((LEDColor.OFF, None, 0))
+        return self._start_effect('self_test', steps, LEDState.OFF)
+        
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the running effect finishes and return its result"""
+        if not self._effect_done.wait(timeout):
+            return False
+        return self._effect_ok
+        
+    def _start_effect(self, name: str, steps: List[tuple], final_state: LEDState) -> bool:
+        """Queue effect steps and hand the indicator to the ticker"""
+        with self._effect_lock:
+            self._cancel_effect()
+            self._effect_steps = deque(steps)
+            self._effect_final_state = final_state
+            self._effect_ok = True
+            self._effect_done = threading.Event()
+            self._next_t = time.monotonic()
+            self._effect = name
+        get_indicator_manager().schedule_effect(self)
+        return True
+        
+    def _advance(self, now: float) -> bool:
+        """Apply the next effect step; returns False once the effect has finished"""
+        with self._effect_lock:
+            if self._effect is None:
+                return False  # Cancelled since it was scheduled
+            return self._advance_locked()
+            
+    def _advance_locked(self) -> bool:
+        try:
+            color, brightness, hold = self._effect_steps.popleft()
+            if self.status != DeviceStatus.READY:
+                self._finish_effect(False)
+                return False
+                
+            self._fast_set_color(color, self.brightness if brightness is None else brightness)
+            self.current_color = color
+            self.current_state = LEDState.ON if color != LEDColor.OFF else LEDState.OFF
+            
+            if self._effect_steps:
+                # Schedule from the previous deadline so steps don't drift
+                self._next_t += hold
+                return True
+                
+            self._finish_effect(True)
+            return False
+            
+        except Exception as e:
+            self.logger.error("LED effect %s failed: %s", self._effect, e)
+            self._finish_effect(False)
+            return False
+            
+    def _finish_effect(self, ok: bool, final: bool = True) -> None:
+        """Mark the running effect as finished and release waiters"""
+        with self._effect_lock:
+            if self._effect is None:
+                return
+            if ok and final:
+                self.current_state = self._effect_final_state
+            self._effect_ok = ok
+            self._effect_steps = deque()
+            self._effect = None
+            self._effect_done.set()
+            
+    def _cancel_effect(self) -> int:
+        """Pre-empt any running effect; returns the new effect generation"""
+        with self._effect_lock:
+            self._effect_gen += 1
+            # A pre-empted effect is not a failure for whoever is waiting on it
+            self._finish_effect(True, final=False)
+            return self._effect_gen
+        
+    def _build_fast_set_color(self):
+        """Build a (color, brightness) writer bound to this LED's PWM channels
+        
+        With all three channels present the writer inlines the per-channel
+        compare-and-write against _last_duties, avoiding the generic loop,
+        attribute lookups and method dispatch on every effect step.
+        """
+        red_pwm, green_pwm, blue_pwm = self._channel_pwm
+        if red_pwm is None or green_pwm is None or blue_pwm is None:
+            return lambda color, brightness: self._write_duties(
+                [on * brightness for on in _COLOR_MASKS[color]])
+                
+        masks = _COLOR_MASKS
+        last = self._last_duties
+        
+        def fast_set_color(color: LEDColor, brightness: int) -> None:
+            r, g, b = masks[color]
+            r *= brightness
+            g *= brightness
+            b *= brightness
+            if r != last[0]:
+                red_pwm.ChangeDutyCycle(r)
+                last[0] = r
+            if g != last[1]:
+                green_pwm.ChangeDutyCycle(g)
+                last[1] = g
+            if b != last[2]:
+                blue_pwm.ChangeDutyCycle(b)
+                last[2] = b
+                
+        return fast_set_color
+        
+    def _write_duties(self, duties) -> None:
+        """Write per-channel duty cycles (red, green, blue), skipping unchanged channels"""
+        with self._effect_lock:
+            last = self._last_duties
+            for i, (pwm, duty) in enumerate(zip(self._channel_pwm, duties)):
+                if duty != last[i] and pwm is not None:
+                    pwm.ChangeDutyCycle(duty)
+                    last[i] = duty
+                
     def get_current_color(self) -> LEDColor:
         """Get current LED color"""
         return self.current_color
@@ -347,7 +681,12 @@ class IndicatorManager:
     
     def __init__(self):
         self.indicators: Dict[str, IHALIndicator] = {}
-        self.logger = logging.getLogger('TrustMonitor.HAL.IndicatorManager')
+        self.logger = indicator_manager_logger
+        # Indicators with a running effect, driven by one ticker thread
+        self._active: Dict[str, IHALIndicator] = {}
+        self._active_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._ticker = None
         
     def register_indicator(self, indicator: IHALIndicator) -> bool:
         """Register an indicator"""
@@ -377,11 +716,53 @@ class IndicatorManager:
         
     def get_indicator_status(self, indicator_id: str) -> Optional[DeviceStatus]:
         """Get indicator status"""
-        indicator = self.get_indicator(indicator_id)
-        return indicator.get_status() if indicator else None
+        indicator = self.indicators.get(indicator_id)
+        return indicator.status if indicator is not None else None
+        
+    def schedule_effect(self, indicator: IHALIndicator) -> None:
+        """Hand an indicator with a pending effect to the ticker thread"""
+        with self._active_lock:
+            self._active[indicator.device_id] = indicator
+            if self._ticker is None or not self._ticker.is_alive():
+                self._ticker = threading.Thread(
+                    target=self._run_ticker, name='TrustMonitor-IndicatorTicker', daemon=True
+                )
+                self._ticker.start()
+        self._wakeup.set()
+        
+    def _tick(self, now: float) -> Optional[float]:
+        """Advance due effects; returns seconds until the next transition (None if idle)"""
+        with self._active_lock:
+            active = list(self._active.items())
+            
+        next_t = None
+        for device_id, indicator in active:
+            if now >= indicator._next_t and not indicator._advance(now):
+                with self._active_lock:
+                    # A new effect may have been started on it in the meantime
+                    if indicator._effect is None:
+                        self._active.pop(device_id, None)
+                continue
+            if next_t is None or indicator._next_t < next_t:
+                next_t = indicator._next_t
+                
+        return None if next_t is None else max(0.0, next_t - time.monotonic())
+        
+    def _run_ticker(self) -> None:
+        """Ticker thread body: sleep until the next effect transition is due"""
+        while True:
+            self._wakeup.clear()
+            self._wakeup.wait(self._tick(time.monotonic()))
+
+# Global indicator manager, created on first use
+_indicator_manager = None
 
-# Global indicator manager
-indicator_manager = IndicatorManager()
+def get_indicator_manager() -> IndicatorManager:
+    """Get global indicator manager instance"""
+    global _indicator_manager
+    if _indicator_manager is None:
+        _indicator_manager = IndicatorManager()
+    return _indicator_manager
 
 def create_rgb_led(device_id: str = "rgb_led", config: Dict[str, Any] = None) -> RGBLEDIndicator:
     """Create and configure RGB LED indicator"""
@@ -15,36 +15,64 @@ Features:
 """
 
 import logging
-import sys
-import os
+import time
 from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime
 
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+try:
+    from .hal_core import (
+        get_hal_manager, initialize_hal, cleanup_hal,
+        IHALDevice, IHALSensor, IHALIndicator,
+        DeviceStatus, DeviceType, HALError
+    )
+except ImportError:
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_core import (
+        get_hal_manager, initialize_hal, cleanup_hal,
+        IHALDevice, IHALSensor, IHALIndicator,
+        DeviceStatus, DeviceType, HALError
+    )
 
-from hal_core import (
-    get_hal_manager, initialize_hal, cleanup_hal,
-    IHALDevice, IHALSensor, IHALIndicator,
-    DeviceStatus, DeviceType, HALError
-)
-from hal_sensors import create_dht11_sensor, DHT11Sensor
-from hal_indicators import create_rgb_led, RGBLEDIndicator, LEDColor, LEDState
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('TrustMonitor.HAL')
 
+class _NullManager:
+    """Stand-in for HALManager while the HAL is not initialized"""
+    
+    def get_device(self, device_id: str) -> None:
+        """No devices are reachable before initialization"""
+        return None
+        
+    def get_all_status(self) -> Dict[str, DeviceStatus]:
+        """No device status before initialization"""
+        return {}
+        
+    def run_self_tests(self) -> Dict[str, bool]:
+        """No self-tests before initialization"""
+        return {}
+
+_NULL_MANAGER = _NullManager()
+
 class TrustMonitorHAL:
     """Main TrustMonitor HAL interface"""
     
     def __init__(self):
-        self.hal_manager = get_hal_manager()
+        # Configure logging on first use rather than at import time
+        if not logging.getLogger().handlers:
+            logging.basicConfig(level=logging.INFO)
+            
+        # Accessors delegate to hal_manager unconditionally; it stays the null
+        # manager until initialization succeeds
+        self._manager = get_hal_manager()
+        self.hal_manager = _NULL_MANAGER
         self.initialized = False
         self.devices = {}
+        # Typed indexes so sensor/indicator paths skip isinstance scans
+        self._sensors: List[IHALSensor] = []
+        self._indicators: List[IHALIndicator] = []
+        self._sensors_by_id: Dict[str, IHALSensor] = {}
+        self._indicators_by_id: Dict[str, IHALIndicator] = {}
         self.logger = logger
+        # device_id -> (monotonic timestamp, last values) for rate-limited sensors
+        self._sensor_cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
         
     def initialize(self, config: Dict[str, Any] = None) -> bool:
         """Initialize HAL system with devices"""
@@ -70,78 +98,132 @@ class TrustMonitorHAL:
                         'green': 1999,
                         'blue': 5000
                     },
-                    'brightness': 100
+                    'brightness': 100,
+                    'pwm_backend': 'rpi_gpio'
                 }
             }
             
             # Merge with provided config
             if config:
-                for device_id, device_config in config.items():
-                    if device_id in default_config:
-                        default_config[device_id].update(device_config)
-                    else:
-                        default_config[device_id] = device_config
-                        
+                default_config = {**default_config, **{
+                    device_id: {**default_config.get(device_id, {}), **device_config}
+                    for device_id, device_config in config.items()
+                }}
+                
+
             # Create and register devices
             self._register_default_devices(default_config)
             
             # Initialize all devices
-            success = self.hal_manager.initialize_all(default_config)
+            success = self._manager.initialize_all(default_config)
             
             if success:
+                self.hal_manager = self._manager
                 self.initialized = True
                 self.logger.info("TrustMonitor HAL initialized successfully")
             else:
+                self._clear_indexes()
                 self.logger.error("TrustMonitor HAL initialization failed")
                 
             return success
             
         except Exception as e:
+            self._clear_indexes()
             self.logger.error(f"HAL initialization error: {e}")
             return False
             
     def _register_default_devices(self, config: Dict[str, Any]) -> None:
         """Register default devices"""
         try:
-            # Register DHT11 sensor
+            # Device drivers pull in GPIO/board libraries, so load them only when needed
+            try:
+                from .hal_sensors import create_dht11_sensor
+                from .hal_indicators import create_rgb_led
+            except ImportError:
+                from hal_sensors import create_dht11_sensor
+                from hal_indicators import create_rgb_led
+                
+            devices = []
+            
+            # DHT11 sensor
             if 'dht11_sensor' in config:
-                dht11 = create_dht11_sensor('dht11_sensor')
-                dht11.set_config(config['dht11_sensor'])
-                self.hal_manager.register_device(dht11)
-                self.devices['dht11_sensor'] = dht11
+                devices.append(create_dht11_sensor('dht11_sensor', config['dht11_sensor']))
                 
-            # Register RGB LED
+            # RGB LED
             if 'rgb_led' in config:
-                rgb_led = create_rgb_led('rgb_led')
-                rgb_led.set_config(config['rgb_led'])
-                self.hal_manager.register_device(rgb_led)
-                self.devices['rgb_led'] = rgb_led
+                devices.append(create_rgb_led('rgb_led', config['rgb_led']))
+                
+            # Register in one batch
+            if self._manager.register_devices(devices):
+                for device in devices:
+                    self._index_device(device)
                 
         except Exception as e:
             self.logger.error(f"Failed to register default devices: {e}")
             
+    def _index_device(self, device: IHALDevice) -> None:
+        """Add a registered device to the device map and typed indexes"""
+        device_id = device.device_id
+        previous = self.devices.get(device_id)
+        if previous is not None:
+            self._unindex_device(previous)
+        self.devices[device_id] = device
+        
+        if isinstance(device, IHALSensor):
+            self._sensors.append(device)
+            self._sensors_by_id[device_id] = device
+        elif isinstance(device, IHALIndicator):
+            self._indicators.append(device)
+            self._indicators_by_id[device_id] = device
+            
+    def _unindex_device(self, device: IHALDevice) -> None:
+        """Remove a device from the typed indexes"""
+        if self._sensors_by_id.pop(device.device_id, None) is not None:
+            self._sensors.remove(device)
+        elif self._indicators_by_id.pop(device.device_id, None) is not None:
+            self._indicators.remove(device)
+            
+    def _clear_indexes(self) -> None:
+        """Empty the typed indexes so sensor/indicator accessors find nothing"""
+        self._sensors.clear()
+        self._indicators.clear()
+        self._sensors_by_id.clear()
+        self._indicators_by_id.clear()
+        self._sensor_cache.clear()
+        
     def cleanup(self) -> bool:
         """Cleanup HAL system"""
         try:
-            success = self.hal_manager.cleanup_all()
+            success = self._manager.cleanup_all()
+            self.hal_manager = _NULL_MANAGER
             self.initialized = False
             self.devices.clear()
+            self._clear_indexes()
             return success
         except Exception as e:
             self.logger.error(f"HAL cleanup error: {e}")
             return False
             
+    def get_sensor(self, sensor_id: str) -> Optional[IHALSensor]:
+        """Get a registered sensor device"""
+        return self._sensors_by_id.get(sensor_id)
+        
+    def get_indicator(self, indicator_id: str) -> Optional[IHALIndicator]:
+        """Get a registered indicator device"""
+        return self._indicators_by_id.get(indicator_id)
+        
+    def is_sensor_stale(self, sensor_id: str) -> bool:
+        """Whether a sensor appears frozen on one reading"""
+        sensor = self._sensors_by_id.get(sensor_id)
+        return sensor is not None and sensor.is_stale()
+        
     def get_sensor_values(self, sensor_id: str = None) -> Dict[str, Dict[str, float]]:
         """Get sensor values"""
         try:
-            if not self.initialized:
-                self.logger.error("HAL not initialized")
-                return {}
-                
             if sensor_id:
-                device = self.hal_manager.get_device(sensor_id)
-                if device and isinstance(device, IHALSensor):
-                    values = device.read_values()
+                device = self._sensors_by_id.get(sensor_id)
+                if device is not None:
+                    values = self._read_sensor(sensor_id, device)
                     return {sensor_id: values} if values else {}
                 else:
                     self.logger.warning(f"Sensor {sensor_id} not found or not a sensor")
@@ -149,26 +231,33 @@ class TrustMonitorHAL:
             else:
                 # Get all sensor values
                 results = {}
-                for device_id, device in self.devices.items():
-                    if isinstance(device, IHALSensor):
-                        values = device.read_values()
-                        if values:
-                            results[device_id] = values
+                for device in self._sensors:
+                    values = self._read_sensor(device.device_id, device)
+                    if values:
+                        results[device.device_id] = values
                 return results
                 
         except Exception as e:
             self.logger.error(f"Failed to get sensor values: {e}")
             return {}
             
+    def _read_sensor(self, device_id: str, device: IHALSensor) -> Dict[str, float]:
+        """Read a sensor, serving repeat calls within min_read_interval from cache"""
+        min_interval = device.get_config('min_read_interval') or 0
+        cached = self._sensor_cache.get(device_id)
+        if cached is not None and time.monotonic() - cached[0] < min_interval:
+            return cached[1]
+            
+        values = device.read_values()
+        if values:
+            self._sensor_cache[device_id] = (time.monotonic(), values)
+        return values
+        
     def set_indicator_state(self, indicator_id: str, state: str, **kwargs) -> bool:
         """Set indicator state"""
         try:
-            if not self.initialized:
-                self.logger.error("HAL not initialized")
-                return False
-                
-            device = self.hal_manager.get_device(indicator_id)
-            if device and isinstance(device, IHALIndicator):
+            device = self._indicators_by_id.get(indicator_id)
+            if device is not None:
                 return device.set_state(state, **kwargs)
             else:
                 self.logger.warning(f"Indicator {indicator_id} not found or not an indicator")
@@ -181,17 +270,8 @@ class TrustMonitorHAL:
     def clear_all_indicators(self) -> bool:
         """Clear all indicators"""
         try:
-            if not self.initialized:
-                self.logger.error("HAL not initialized")
-                return False
-                
-            success = True
-            for device_id, device in self.devices.items():
-                if isinstance(device, IHALIndicator):
-                    if not device.clear():
-                        success = False
-                        
-            return success
+            # List, not generator: every indicator must be cleared even after a failure
+            return all([device.clear() for device in self._indicators])
             
         except Exception as e:
             self.logger.error(f"Failed to clear indicators: {e}")
@@ -200,13 +280,9 @@ class TrustMonitorHAL:
     def get_device_status(self, device_id: str = None) -> Dict[str, DeviceStatus]:
         """Get device status"""
         try:
-            if not self.initialized:
-                self.logger.error("HAL not initialized")
-                return {}
-                
             if device_id:
                 device = self.hal_manager.get_device(device_id)
-                if device:
+                if device is not None:
                     return {device_id: device.get_status()}
                 else:
                     return {}
@@ -220,10 +296,6 @@ class TrustMonitorHAL:
     def run_self_tests(self) -> Dict[str, bool]:
         """Run self-tests on all devices"""
         try:
-            if not self.initialized:
-                self.logger.error("HAL not initialized")
-                return {}
-                
             return self.hal_manager.run_self_tests()
             
         except Exception as e:
@@ -233,7 +305,7 @@ class TrustMonitorHAL:
     def list_devices(self) -> Dict[str, Dict[str, Any]]:
         """List all devices"""
         try:
-            return self.hal_manager.list_devices()
+            return self._manager.list_devices()
         except Exception as e:
             self.logger.error(f"Failed to list devices: {e}")
             return {}
@@ -14,18 +14,40 @@ Features:
 """
 
 import argparse
-import sys
+import copy
 import os
-from datetime import datetime
-import logging
+import signal
 
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+try:
+    from .hal_interface import get_hal, initialize_hardware, cleanup_hardware
+    from .hal_indicators import LEDColor
+    from .hal_core import get_console_logger
+except ImportError:
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_interface import get_hal, initialize_hardware, cleanup_hardware
+    from hal_indicators import LEDColor
+    from hal_core import get_console_logger
 
-from hal_interface import get_hal, initialize_hardware, cleanup_hardware
-from hal_indicators import LEDColor
+# Timestamped status lines on stdout
+logger = get_console_logger('TrustMonitor.HAL.LedController')
+
+# Default LED configuration, read from the environment once at import
+_DEFAULT_LED_CONFIG = {
+    'rgb_led': {
+        'pins': {
+            'red': int(os.getenv('LED_RED_PIN', '27')),
+            'green': int(os.getenv('LED_GREEN_PIN', '22')),
+            'blue': int(os.getenv('LED_BLUE_PIN', '5'))
+        },
+        'frequencies': {
+            'red': 2000,
+            'green': 1999,
+            'blue': 5000
+        },
+        'brightness': int(os.getenv('LED_BRIGHTNESS', '100')),
+        'pwm_backend': os.getenv('LED_PWM_BACKEND', 'rpi_gpio')
+    }
+}
 
 class HALLedController:
     """HAL-based LED controller with backward compatibility"""
@@ -34,27 +56,13 @@ class HALLedController:
         """Initialize HAL LED controller"""
         self.hal = get_hal()
         self.initialized = False
-        self.logger = logging.getLogger('TrustMonitor.HAL.LedController')
+        self.logger = logger
         
     def initialize(self, config: dict = None):
         """Initialize LED controller"""
         try:
-            # Default LED configuration
-            default_config = {
-                'rgb_led': {
-                    'pins': {
-                        'red': int(os.getenv('LED_RED_PIN', '27')),
-                        'green': int(os.getenv('LED_GREEN_PIN', '22')),
-                        'blue': int(os.getenv('LED_BLUE_PIN', '5'))
-                    },
-                    'frequencies': {
-                        'red': 2000,
-                        'green': 1999,
-                        'blue': 5000
-                    },
-                    'brightness': int(os.getenv('LED_BRIGHTNESS', '100'))
-                }
-            }
+            # Default LED configuration (fresh copy; HAL keeps references to it)
+            default_config = copy.deepcopy(_DEFAULT_LED_CONFIG)
             
             # Merge with provided config
             if config:
@@ -65,10 +73,10 @@ class HALLedController:
                 raise RuntimeError("Failed to initialize HAL")
                 
             self.initialized = True
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] HAL LED controller initialized successfully")
+            self.logger.info("HAL LED controller initialized successfully")
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: HAL LED controller initialization failed - {e}")
+            self.logger.error("ERROR: HAL LED controller initialization failed - %s", e)
             raise
     
     def set_pure_color(self, color: str):
@@ -80,12 +88,12 @@ class HALLedController:
             success = self.hal.set_indicator_state('rgb_led', 'on', color=color)
             
             if success:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Setting {color} LED")
+                self.logger.info("Setting %s LED", color)
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Failed to set {color} LED")
+                self.logger.error("ERROR: Failed to set %s LED", color)
                 
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {e}")
+            self.logger.error("ERROR: %s", e)
     
     def turn_off_all(self):
         """Turn off all LEDs - backward compatibility"""
@@ -96,12 +104,12 @@ class HALLedController:
             success = self.hal.clear_all_indicators()
             
             if success:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] All LEDs turned off")
+                self.logger.info("All LEDs turned off")
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Failed to turn off LEDs")
+                self.logger.warning("WARNING: Failed to turn off LEDs")
                 
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {e}")
+            self.logger.error("ERROR: %s", e)
     
     def blink_color(self, color: str, times: int = 5, speed: float = 0.5):
         """Blink specified color - backward compatibility"""
@@ -109,27 +117,27 @@ class HALLedController:
             if not self.initialized:
                 raise RuntimeError("LED controller not initialized")
             
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {color} LED blinking - {times} times, {speed}s interval")
+            self.logger.info("Starting %s LED blinking - %s times, %ss interval", color, times, speed)
             
             success = self.hal.set_indicator_state('rgb_led', 'blinking', 
                                                  color=color, times=times, speed=speed)
             
             if success:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {color} LED blinking completed")
+                self.logger.info("%s LED blinking completed", color)
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Failed to blink {color} LED")
+                self.logger.error("ERROR: Failed to blink %s LED", color)
                 
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {e}")
+            self.logger.error("ERROR: %s", e)
     
     def cleanup(self):
         """Clean up resources"""
         try:
             if self.hal:
                 self.hal.cleanup()
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] HAL LED controller cleanup completed")
+            self.logger.info("HAL LED controller cleanup completed")
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Cleanup failed - {e}")
+            self.logger.warning("WARNING: Cleanup failed - %s", e)
 
 def main():
     """Main program - Command line interface with backward compatibility"""
@@ -148,30 +156,29 @@ def main():
         controller.initialize()
         
         if args.color:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Setting {args.color} LED - press Ctrl+C to stop")
+            logger.info("Setting %s LED - press Ctrl+C to stop", args.color)
             controller.set_pure_color(args.color)
             
-            # Wait for user interrupt
+            # Wait for user interrupt without waking up periodically
             try:
                 while True:
-                    import time
-                    time.sleep(1)
+                    signal.pause()
             except KeyboardInterrupt:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted, turning off LED")
+                logger.info("User interrupted, turning off LED")
                 controller.turn_off_all()
                 
         elif args.blink:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {args.blink} LED blinking")
+            logger.info("Starting %s LED blinking", args.blink)
             controller.blink_color(args.blink, args.times, args.speed)
             
         elif args.off:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Turning off all LEDs")
+            logger.info("Turning off all LEDs")
             controller.turn_off_all()
         else:
             parser.print_help()
             
     except KeyboardInterrupt:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted operation")
+        logger.info("User interrupted operation")
     except Exception as e:
         print(f"ERROR: {e}")
     finally:
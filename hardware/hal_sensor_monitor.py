@@ -14,69 +14,100 @@ Features:
 - Environment variable support
 """
 
-import time
+import asyncio
+import bisect
+import functools
 import sys
 import os
-from datetime import datetime
 from typing import Optional, Dict, Any
-import logging
 
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+try:
+    from .hal_interface import get_hal, initialize_hardware, cleanup_hardware
+    from .hal_indicators import LEDColor
+    from .hal_core import get_console_logger
+except ImportError:
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_interface import get_hal, initialize_hardware, cleanup_hardware
+    from hal_indicators import LEDColor
+    from hal_core import get_console_logger
 
-from hal_interface import get_hal, initialize_hardware, cleanup_hardware
-from hal_indicators import LEDColor
+# Timestamped status lines on stdout
+logger = get_console_logger('TrustMonitor.HAL.SensorMonitor')
+
+# LED status per threshold level: below warning, warning, error
+STATUS_LEVELS = ('green', 'blue', 'red')
+
+# Off time before a recolor on indicators that must be cleared first (seconds)
+LED_CLEAR_SETTLE = 0.02
 
 class SensorConfig:
     """Sensor configuration management"""
     
+    # (environment variable, default, type, attribute)
+    ENV_SPEC = (
+        # Monitoring interval (seconds)
+        ('SENSOR_MONITOR_INTERVAL', '60', int, 'monitor_interval'),
+        # Temperature and humidity thresholds
+        ('TEMP_WARNING', '40.0', float, 'temp_warning'),
+        ('TEMP_ERROR', '45.0', float, 'temp_error'),
+        ('HUMIDITY_WARNING', '70.0', float, 'humidity_warning'),
+        ('HUMIDITY_ERROR', '80.0', float, 'humidity_error'),
+        # Sensor retry configuration
+        ('SENSOR_MAX_RETRIES', '3', int, 'sensor_max_retries'),
+        ('SENSOR_RETRY_DELAY', '1.0', float, 'sensor_retry_delay'),
+        ('SENSOR_STALE_FRAMES', '720', int, 'sensor_stale_frames'),
+        # Hardware pins and LED settings
+        ('DHT_PIN', 'D17', str, 'dht_pin'),
+        ('LED_RED_PIN', '27', int, 'led_red_pin'),
+        ('LED_GREEN_PIN', '22', int, 'led_green_pin'),
+        ('LED_BLUE_PIN', '5', int, 'led_blue_pin'),
+        ('LED_BRIGHTNESS', '100', int, 'led_brightness'),
+        ('LED_PWM_BACKEND', 'rpi_gpio', str, 'led_pwm_backend'),
+    )
+    
     def __init__(self):
         self.load_config()
     
     def load_config(self):
         """Load configuration with environment variable priority"""
-        # Monitoring interval (seconds)
-        self.monitor_interval = int(os.getenv('SENSOR_MONITOR_INTERVAL', '60'))
-        
-        # Temperature and humidity thresholds
-        self.temp_warning = float(os.getenv('TEMP_WARNING', '40.0'))
-        self.temp_error = float(os.getenv('TEMP_ERROR', '45.0'))
-        self.humidity_warning = float(os.getenv('HUMIDITY_WARNING', '70.0'))
-        self.humidity_error = float(os.getenv('HUMIDITY_ERROR', '80.0'))
-        
-        # Sensor retry configuration
-        self.sensor_max_retries = int(os.getenv('SENSOR_MAX_RETRIES', '3'))
-        self.sensor_retry_delay = float(os.getenv('SENSOR_RETRY_DELAY', '1.0'))
+        env = os.environ
+        for name, default, convert, attr in self.ENV_SPEC:
+            setattr(self, attr, convert(env.get(name, default)))
+            
+        # Sorted threshold bins for determine_status; index into STATUS_LEVELS.
+        # A warning threshold above the error threshold can never yield 'blue'.
+        self.temp_bins = (min(self.temp_warning, self.temp_error), self.temp_error)
+        self.humidity_bins = (min(self.humidity_warning, self.humidity_error), self.humidity_error)
         
         # HAL configuration
         self.hal_config = {
             'dht11_sensor': {
-                'pin': os.getenv('DHT_PIN', 'D17'),
+                'pin': self.dht_pin,
                 'max_retries': self.sensor_max_retries,
                 'retry_delay': self.sensor_retry_delay,
-                'min_read_interval': 2.0
+                'min_read_interval': 2.0,
+                'stale_frame_threshold': self.sensor_stale_frames
             },
             'rgb_led': {
                 'pins': {
-                    'red': int(os.getenv('LED_RED_PIN', '27')),
-                    'green': int(os.getenv('LED_GREEN_PIN', '22')),
-                    'blue': int(os.getenv('LED_BLUE_PIN', '5'))
+                    'red': self.led_red_pin,
+                    'green': self.led_green_pin,
+                    'blue': self.led_blue_pin
                 },
                 'frequencies': {
                     'red': 2000,
                     'green': 1999,
                     'blue': 5000
                 },
-                'brightness': int(os.getenv('LED_BRIGHTNESS', '100'))
+                'brightness': self.led_brightness,
+                'pwm_backend': self.led_pwm_backend
             }
         }
         
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Configuration loaded successfully")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Monitoring interval: {self.monitor_interval} seconds")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Temperature thresholds: warning {self.temp_warning}°C, error {self.temp_error}°C")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Humidity thresholds: warning {self.humidity_warning}%, error {self.humidity_error}%")
+        logger.info("Configuration loaded successfully")
+        logger.info("Monitoring interval: %s seconds", self.monitor_interval)
+        logger.info("Temperature thresholds: warning %s°C, error %s°C", self.temp_warning, self.temp_error)
+        logger.info("Humidity thresholds: warning %s%%, error %s%%", self.humidity_warning, self.humidity_error)
 
 class HALSensorMonitor:
     """HAL-based sensor monitoring service"""
@@ -86,7 +117,7 @@ class HALSensorMonitor:
         self.config = SensorConfig()
         self.hal = get_hal()
         self.current_status = None
-        self.logger = logging.getLogger('TrustMonitor.HAL.SensorMonitor')
+        self.logger = logger
         
     def initialize(self):
         """
@@ -102,7 +133,7 @@ class HALSensorMonitor:
             Exception: For other initialization errors
         """
         try:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Initializing HAL sensor monitor...")
+            self.logger.info("Initializing HAL sensor monitor...")
             
             # Step 1: Initialize HAL with device configuration
             # This registers all devices (DHT11 sensor, RGB LED) and sets up GPIO/PWM
@@ -115,82 +146,89 @@ class HALSensorMonitor:
             failed_tests = [device for device, result in test_results.items() if not result]
             
             if failed_tests:
-                self.logger.warning(f"Some devices failed self-test: {failed_tests}")
+                self.logger.warning("Some devices failed self-test: %s", failed_tests)
                 # Note: We continue initialization even with some failures
                 # This allows partial functionality (e.g., LED works even if sensor fails)
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] All devices passed self-test")
+                self.logger.info("All devices passed self-test")
                 
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] HAL sensor monitor initialization completed")
+            self.logger.info("HAL sensor monitor initialization completed")
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: HAL sensor monitor initialization failed - {e}")
+            self.logger.error("ERROR: HAL sensor monitor initialization failed - %s", e)
             raise
     def determine_status(self, temperature: float, humidity: float) -> str:
         """Determine LED status based on temperature and humidity"""
-        # Check error thresholds
-        if temperature >= self.config.temp_error or humidity >= self.config.humidity_error:
+        # A frozen sensor can't be trusted to report a healthy environment
+        if self.hal.is_sensor_stale('dht11_sensor'):
             return 'red'
-        
-        # Check warning thresholds
-        if temperature >= self.config.temp_warning or humidity >= self.config.humidity_warning:
-            return 'blue'
-        
-        # Normal status
-        return 'green'
+            
+        # The worse of the two readings decides; bisect_right counts thresholds reached (>=)
+        level = max(bisect.bisect_right(self.config.temp_bins, temperature),
+                    bisect.bisect_right(self.config.humidity_bins, humidity))
+        return STATUS_LEVELS[level]
     
-    def update_led_status(self, status: str):
+    async def update_led_status(self, status: str):
         """Update LED status using HAL"""
         if status != self.current_status:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Status changed: {self.current_status} -> {status}")
-            
-            # Clear all indicators first
-            self.hal.clear_all_indicators()
-            
-            # Wait to ensure LEDs are off
-            time.sleep(0.5)
+            self.logger.info("Status changed: %s -> %s", self.current_status, status)
+            loop = asyncio.get_running_loop()
             
+            # Indicators that can't recolor in place are cleared and given a short
+            # settle time (~40 periods at 2kHz PWM) first
+            indicator = self.hal.get_indicator('rgb_led')
+            if indicator is None or not indicator.supports_atomic_color:
+                await loop.run_in_executor(None, self.hal.clear_all_indicators)
+                await asyncio.sleep(LED_CLEAR_SETTLE)
+                
             # Set new status
-            success = self.hal.set_indicator_state('rgb_led', 'on', color=status)
+            success = await loop.run_in_executor(
+                None, functools.partial(self.hal.set_indicator_state, 'rgb_led', 'on', color=status))
             
             if success:
                 self.current_status = status
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] LED {status} set successfully")
+                self.logger.info("LED %s set successfully", status)
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Failed to set LED {status}")
+                self.logger.warning("WARNING: Failed to set LED %s", status)
     
-    def read_sensors(self) -> Optional[Dict[str, float]]:
+    async def read_sensors(self) -> Optional[Dict[str, float]]:
         """Read temperature and humidity using HAL"""
         try:
-            # Read sensor values through HAL
-            sensor_values = self.hal.get_sensor_values('dht11_sensor')
+            # Read the sensor through HAL off the event loop
+            sensor = self.hal.get_sensor('dht11_sensor')
+            if sensor is None:
+                values = {}
+            elif hasattr(sensor, 'read_values_async'):
+                values = await sensor.read_values_async()
+            else:
+                # Sensors without an async path read on the default executor
+                values = await asyncio.get_running_loop().run_in_executor(None, sensor.read_values)
             
-            if 'dht11_sensor' in sensor_values:
-                values = sensor_values['dht11_sensor']
+            if values:
                 temperature = values.get('temperature')
                 humidity = values.get('humidity')
                 
                 if temperature is not None and humidity is not None:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor read successful: temperature {temperature:.1f}°C, humidity {humidity:.1f}%")
+                    self.logger.info("Sensor read successful: temperature %.1f°C, humidity %.1f%%", temperature, humidity)
                     return {'temperature': temperature, 'humidity': humidity}
                 else:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Sensor returned None values")
+                    self.logger.warning("WARNING: Sensor returned None values")
                     return None
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: No sensor data available")
+                self.logger.warning("WARNING: No sensor data available")
                 return None
                 
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Sensor read failed - {e}")
+            self.logger.error("ERROR: Sensor read failed - %s", e)
             return None
     
-    def run_once(self):
+    async def run_once(self):
         """Execute one monitoring cycle"""
         try:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting HAL sensor reading...")
+            self.logger.info("Starting HAL sensor reading...")
             
             # Read sensors
-            result = self.read_sensors()
+            result = await self.read_sensors()
             
             if result is not None:
                 temperature = result['temperature']
@@ -200,30 +238,39 @@ class HALSensorMonitor:
                 status = self.determine_status(temperature, humidity)
                 
                 # Update LED status
-                self.update_led_status(status)
+                await self.update_led_status(status)
                 
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Temperature: {temperature:.1f}°C, Humidity: {humidity:.1f}%, Status: {status}")
+                self.logger.info("Temperature: %.1f°C, Humidity: %.1f%%, Status: %s", temperature, humidity, status)
             else:
                 # Sensor failed, turn on red LED
-                self.update_led_status('red')
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor read failed, status: {self.current_status}")
+                await self.update_led_status('red')
+                self.logger.info("Sensor read failed, status: %s", self.current_status)
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Monitoring execution failed - {e}")
+            self.logger.error("ERROR: Monitoring execution failed - %s", e)
     
-    def run_continuous(self):
+    async def run_continuous(self):
         """Continuous monitoring"""
         try:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting continuous HAL monitoring, interval: {self.config.monitor_interval} seconds")
+            self.logger.info("Starting continuous HAL monitoring, interval: %s seconds", self.config.monitor_interval)
             
+            # Fixed-phase schedule: the time run_once takes doesn't push later cycles back
+            loop = asyncio.get_running_loop()
+            next_time = loop.time()
             while True:
-                self.run_once()
-                time.sleep(self.config.monitor_interval)
+                await self.run_once()
+                next_time += self.config.monitor_interval
+                delay = next_time - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Overran the interval; restart the schedule rather than bursting to catch up
+                    next_time = loop.time()
                 
         except KeyboardInterrupt:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted monitoring")
+            self.logger.info("User interrupted monitoring")
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Continuous monitoring failed - {e}")
+            self.logger.error("ERROR: Continuous monitoring failed - %s", e)
         finally:
             self.cleanup()
     
@@ -232,16 +279,16 @@ class HALSensorMonitor:
         try:
             if self.hal:
                 self.hal.cleanup()
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] HAL sensor monitor cleanup completed")
+            self.logger.info("HAL sensor monitor cleanup completed")
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Cleanup failed - {e}")
+            self.logger.warning("WARNING: Cleanup failed - %s", e)
     
     def get_device_status(self) -> Dict[str, Any]:
         """Get device status information"""
         try:
             return self.hal.get_device_status()
         except Exception as e:
-            self.logger.error(f"Failed to get device status: {e}")
+            self.logger.error("Failed to get device status: %s", e)
             return {}
 
 def print_usage():
@@ -257,6 +304,7 @@ def print_usage():
     print()
     print("Environment Variables:")
     print("  SENSOR_MONITOR_INTERVAL  Monitoring interval (seconds, default 60)")
+    print("  SENSOR_STALE_FRAMES    Identical readings before the sensor counts as frozen (default 720)")
     print("  TEMP_WARNING           Temperature warning threshold (°C, default 40.0)")
     print("  TEMP_ERROR             Temperature error threshold (°C, default 45.0)")
     print("  HUMIDITY_WARNING       Humidity warning threshold (%), default 70.0)")
@@ -266,6 +314,7 @@ def print_usage():
     print("  LED_GREEN_PIN          Green LED pin (default 22)")
     print("  LED_BLUE_PIN           Blue LED pin (default 5)")
     print("  LED_BRIGHTNESS         LED brightness (default 100)")
+    print("  LED_PWM_BACKEND        LED PWM backend: rpi_gpio or pigpio (default rpi_gpio)")
     print()
     sys.exit(0)
 
@@ -284,7 +333,7 @@ def main():
         
         # Show device status
         if len(sys.argv) > 1 and sys.argv[1] == '--status':
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Device Status:")
+            logger.info("Device Status:")
             status = monitor.get_device_status()
             for device_id, device_status in status.items():
                 print(f"  {device_id}: {device_status.value}")
@@ -292,17 +341,17 @@ def main():
         
         # Execute one test
         if len(sys.argv) > 1 and sys.argv[1] in ['--test', '-t']:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Executing one HAL test...")
-            monitor.run_once()
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test completed")
+            logger.info("Executing one HAL test...")
+            asyncio.run(monitor.run_once())
+            logger.info("Test completed")
         else:
             # Continuous monitoring
-            monitor.run_continuous()
+            asyncio.run(monitor.run_continuous())
             
     except KeyboardInterrupt:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted monitoring")
+        logger.info("User interrupted monitoring")
     except Exception as e:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {e}")
+        logger.error("ERROR: %s", e)
         sys.exit(1)
     finally:
         monitor.cleanup()
@@ -13,20 +13,67 @@ Features:
 - Configuration management
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Tuple
+import asyncio
+import random
 import time
 import logging
-from datetime import datetime
+
+# DHT libraries are imported on first sensor initialization (board runs Blinka platform detection)
+board = None
+adafruit_dht = None
+DHT_AVAILABLE = False
+_dht_import_attempted = False
+
+# board pin name -> pin object
+_PIN_CACHE: Dict[str, Any] = {}
 
 try:
-    import board
-    import adafruit_dht
-    DHT_AVAILABLE = True
+    from .hal_core import (
+        IHALSensor, DeviceStatus, DeviceType, HALError, DeviceOperationError, MAX_PARALLEL_DEVICES
+    )
 except ImportError:
-    DHT_AVAILABLE = False
-    print("WARNING: DHT libraries not available, sensor will run in simulation mode")
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_core import (
+        IHALSensor, DeviceStatus, DeviceType, HALError, DeviceOperationError, MAX_PARALLEL_DEVICES
+    )
+
+sensor_manager_logger = logging.getLogger('TrustMonitor.HAL.SensorManager')
+
+def _load_dht() -> bool:
+    """Import board/adafruit_dht once; returns whether they are available"""
+    global board, adafruit_dht, DHT_AVAILABLE, _dht_import_attempted
+    if not _dht_import_attempted:
+        _dht_import_attempted = True
+        try:
+            import board as board_module
+            import adafruit_dht as adafruit_dht_module
+            board = board_module
+            adafruit_dht = adafruit_dht_module
+            DHT_AVAILABLE = True
+        except ImportError:
+            DHT_AVAILABLE = False
+            print("WARNING: DHT libraries not available, sensor will run in simulation mode")
+    return DHT_AVAILABLE
+
+def _resolve_pin(name: str) -> Any:
+    """Look up a board pin object by name, caching the result"""
+    pin = _PIN_CACHE.get(name)
+    if pin is None:
+        pin = getattr(board, name)
+        _PIN_CACHE[name] = pin
+    return pin
 
-from hal_core import IHALSensor, DeviceStatus, DeviceType, HALError, DeviceOperationError
+# adafruit_dht ignores measure() calls (failed ones included) within 2 s of
+# the previous call and hands back the old frame, so nothing sooner is a new read
+DHT11_MIN_FRAME_INTERVAL = 2.0
+# Upper bound on a single DHT11 frame read, pulse capture and decode (seconds)
+DHT11_FRAME_READ_TIME = 1.0
+# Largest factor retry jitter stretches a delay by
+DHT11_RETRY_JITTER = 1.2
+# Slack SensorManager.read_all_sensors adds to a sensor's worst-case read time
+SENSOR_READ_MARGIN = 5.0
 
 class DHT11Sensor(IHALSensor):
     """HAL implementation for DHT11 temperature/humidity sensor"""
@@ -39,6 +86,15 @@ class DHT11Sensor(IHALSensor):
         self.retry_delay = 2.0
         self.last_reading_time = 0
         self.min_read_interval = 2.0  # Minimum time between readings
+        # Channels decoded from the most recent data frame
+        self._temperature = None
+        self._humidity = None
+        self._last_frame_time = 0.0
+        # Consecutive identical frames; a frozen DHT11 keeps repeating its last frame
+        self.stale_frame_threshold = 720
+        self._same_frame_count = 0
+        # Single worker so bit-banged reads never overlap; created on first async read
+        self._executor: Optional[ThreadPoolExecutor] = None
         
     def initialize(self, config: Dict[str, Any] = None) -> bool:
         """Initialize DHT11 sensor"""
@@ -47,21 +103,23 @@ class DHT11Sensor(IHALSensor):
             if config:
                 self.set_config(config)
                 
-            # Get configuration values
-            self.max_retries = self.get_config('max_retries') or 3
-            self.retry_delay = self.get_config('retry_delay') or 2.0
-            self.min_read_interval = self.get_config('min_read_interval') or 2.0
-            pin_config = self.get_config('pin') or 'D17'
+            # Get configuration values (explicit 0 is honoured, unlike an `or` default)
+            cfg = self.config
+            self.max_retries = cfg.get('max_retries', 3)
+            self.retry_delay = cfg.get('retry_delay', 2.0)
+            self.min_read_interval = cfg.get('min_read_interval', 2.0)
+            self.stale_frame_threshold = cfg.get('stale_frame_threshold', 720)
+            pin_config = cfg.get('pin') or 'D17'
             
-            self.logger.info(f"Initializing DHT11 sensor on pin {pin_config}")
+            self.logger.info("Initializing DHT11 sensor on pin %s", pin_config)
             
-            if not DHT_AVAILABLE:
+            if not _load_dht():
                 self.logger.warning("DHT libraries not available, enabling simulation mode")
                 self.status = DeviceStatus.READY
                 return True
                 
             # Initialize sensor
-            pin_obj = getattr(board, pin_config)
+            pin_obj = _resolve_pin(pin_config)
             self.dht = adafruit_dht.DHT11(pin_obj, use_pulseio=False)
             self.pin = pin_config
             
@@ -77,7 +135,7 @@ class DHT11Sensor(IHALSensor):
                 
         except Exception as e:
             self.set_error(e)
-            self.logger.error(f"DHT11 sensor initialization failed: {e}")
+            self.logger.error("DHT11 sensor initialization failed: %s", e)
             return False
             
     def cleanup(self) -> bool:
@@ -87,12 +145,18 @@ class DHT11Sensor(IHALSensor):
                 # DHT library doesn't have explicit cleanup, but we can reset reference
                 self.dht = None
                 
+            self._temperature = None
+            self._humidity = None
+            self._same_frame_count = 0
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             self.status = DeviceStatus.UNINITIALIZED
             self.logger.info("DHT11 sensor cleanup completed")
             return True
             
         except Exception as e:
-            self.logger.error(f"DHT11 sensor cleanup failed: {e}")
+            self.logger.error("DHT11 sensor cleanup failed: %s", e)
             return False
             
     def self_test(self) -> bool:
@@ -106,7 +170,7 @@ class DHT11Sensor(IHALSensor):
             return temp is not None and humidity is not None
             
         except Exception as e:
-            self.logger.error(f"DHT11 self-test failed: {e}")
+            self.logger.error("DHT11 self-test failed: %s", e)
             return False
             
     def get_status(self) -> DeviceStatus:
@@ -122,11 +186,17 @@ class DHT11Sensor(IHALSensor):
             if sensor_type not in ['temperature', 'humidity']:
                 raise ValueError(f"Invalid sensor type: {sensor_type}")
                 
+            # Serve from the last frame while it is fresh instead of re-entering read_values
+            if time.time() - self.last_reading_time < self.min_read_interval:
+                cached = self._temperature if sensor_type == 'temperature' else self._humidity
+                if cached is not None:
+                    return cached
+                    
             values = self.read_values()
             return values.get(sensor_type)
             
         except Exception as e:
-            self.logger.error(f"Failed to read {sensor_type}: {e}")
+            self.logger.error("Failed to read %s: %s", sensor_type, e)
             return None
             
     def read_values(self) -> Dict[str, float]:
@@ -138,8 +208,13 @@ class DHT11Sensor(IHALSensor):
             # Check minimum read interval
             current_time = time.time()
             if current_time - self.last_reading_time < self.min_read_interval:
-                self.logger.debug("Skipping read - minimum interval not reached")
-                return {}
+                self.logger.debug("Minimum interval not reached - returning last frame")
+                if self._temperature is None or self._humidity is None:
+                    return {}
+                return {
+                    'temperature': self._temperature,
+                    'humidity': self._humidity
+                }
                 
             temp, humidity = self._read_with_retry()
             
@@ -153,9 +228,15 @@ class DHT11Sensor(IHALSensor):
                 return {}
                 
         except Exception as e:
-            self.logger.error(f"Failed to read sensor values: {e}")
+            self.logger.error("Failed to read sensor values: %s", e)
             return {}
             
+    async def read_values_async(self) -> Dict[str, float]:
+        """Run the blocking read with retries on the sensor's worker thread"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.device_id)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.read_values)
+        
     def get_unit(self, sensor_type: str) -> str:
         """Get sensor unit"""
         units = {
@@ -175,50 +256,100 @@ class DHT11Sensor(IHALSensor):
             
     def _read_with_retry(self) -> Tuple[Optional[float], Optional[float]]:
         """Read sensor values with retry mechanism"""
-        for attempt in range(self.max_retries):
+        for attempt in range(1, self.max_retries + 1):
             try:
                 temp, humidity = self._read_raw_values()
                 
                 if temp is not None and humidity is not None:
-                    self.logger.debug(f"Sensor read successful on attempt {attempt + 1}")
+                    self.logger.debug("Sensor read successful on attempt %s", attempt)
                     return temp, humidity
                     
             except Exception as e:
-                self.logger.debug(f"Sensor read attempt {attempt + 1} failed: {e}")
+                self.logger.debug("Sensor read attempt %s failed: %s", attempt, e)
                 
-            if attempt < self.max_retries - 1:
-                self.logger.debug(f"Waiting {self.retry_delay}s before retry...")
-                time.sleep(self.retry_delay)
+            if attempt == self.max_retries:
+                break
                 
-        self.logger.warning(f"Sensor read failed after {self.max_retries} attempts")
+            # Jitter only ever lengthens the gap so retries don't line up with
+            # periodic interference
+            delay = self._retry_delay(attempt) * random.uniform(1.0, DHT11_RETRY_JITTER)
+            self.logger.debug("Waiting %.2fs before retry...", delay)
+            time.sleep(delay)
+            
+        self.logger.warning("Sensor read failed after %s attempts", self.max_retries)
         return None, None
         
+    def _retry_delay(self, attempt: int) -> float:
+        """Base delay after the given failed attempt (1-based), before jitter
+        
+        Every retry waits out the driver's frame interval, backing off
+        exponentially up to retry_delay.
+        """
+        return min(max(self.retry_delay, DHT11_MIN_FRAME_INTERVAL),
+                   DHT11_MIN_FRAME_INTERVAL * (2 ** (attempt - 1)))
+        
+    def max_read_time(self) -> float:
+        """Worst-case duration of read_values, all retries and delays included"""
+        sleeps = sum(self._retry_delay(attempt) for attempt in range(1, self.max_retries))
+        return self.max_retries * DHT11_FRAME_READ_TIME + sleeps * DHT11_RETRY_JITTER
+        
     def _read_raw_values(self) -> Tuple[Optional[float], Optional[float]]:
         """Read raw sensor values without retry"""
+        # Back-to-back callers share the last frame instead of starting a new one
+        if (self._temperature is not None and
+                time.monotonic() - self._last_frame_time < DHT11_MIN_FRAME_INTERVAL):
+            return self._temperature, self._humidity
+            
+        temperature, humidity = self._read_sensor()
+        if temperature is not None and humidity is not None:
+            self._track_repeats(temperature, humidity)
+            self._temperature = temperature
+            self._humidity = humidity
+            self._last_frame_time = time.monotonic()
+        return temperature, humidity
+        
+    def _track_repeats(self, temperature: float, humidity: float) -> None:
+        """Count consecutive identical frames and warn once the sensor looks frozen"""
+        if (temperature, humidity) == (self._temperature, self._humidity):
+            self._same_frame_count += 1
+            if self._same_frame_count == self.stale_frame_threshold + 1:
+                self.logger.warning("Sensor returned the same reading for %d consecutive frames - it may be frozen",
+                                    self._same_frame_count + 1)
+        else:
+            self._same_frame_count = 0
+            
+    def is_stale(self) -> bool:
+        """Whether the sensor appears stuck repeating the same reading"""
+        return self._same_frame_count > self.stale_frame_threshold
+        
+    def _read_sensor(self) -> Tuple[Optional[float], Optional[float]]:
+        """Decode temperature and humidity from a single DHT data frame"""
         if not DHT_AVAILABLE:
             # Simulation mode for testing
-            import random
             temp = round(random.uniform(20.0, 35.0), 1)
             humidity = round(random.uniform(40.0, 70.0), 1)
-            self.logger.debug(f"Simulation mode: temp={temp}°C, humidity={humidity}%")
+            self.logger.debug("Simulation mode: temp=%s°C, humidity=%s%%", temp, humidity)
             return temp, humidity
             
         try:
+            # One transaction for both channels; the property reads below
+            # return the values decoded from this frame
+            self.dht.measure()
             temperature = self.dht.temperature
             humidity = self.dht.humidity
             
             if temperature is not None and humidity is not None:
-                self.logger.debug(f"Raw sensor read: temp={temperature}°C, humidity={humidity}%")
+                self.logger.debug("Raw sensor read: temp=%s°C, humidity=%s%%", temperature, humidity)
                 return temperature, humidity
             else:
                 self.logger.debug("Sensor returned None values")
                 return None, None
                 
         except RuntimeError as e:
-            self.logger.debug(f"Sensor runtime error: {e}")
+            self.logger.debug("Sensor runtime error: %s", e)
             return None, None
         except Exception as e:
-            self.logger.error(f"Unexpected sensor error: {e}")
+            self.logger.error("Unexpected sensor error: %s", e)
             return None, None
 
 class SensorManager:
@@ -226,16 +357,18 @@ class SensorManager:
     
     def __init__(self):
         self.sensors: Dict[str, IHALSensor] = {}
-        self.logger = logging.getLogger('TrustMonitor.HAL.SensorManager')
+        self.logger = sensor_manager_logger
+        # Persistent pool for concurrent reads; created when there is more than one sensor
+        self._pool: Optional[ThreadPoolExecutor] = None
         
     def register_sensor(self, sensor: IHALSensor) -> bool:
         """Register a sensor"""
         try:
             self.sensors[sensor.device_id] = sensor
-            self.logger.info(f"Sensor {sensor.device_id} registered")
+            self.logger.info("Sensor %s registered", sensor.device_id)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to register sensor: {e}")
+            self.logger.error("Failed to register sensor: %s", e)
             return False
             
     def get_sensor(self, sensor_id: str) -> Optional[IHALSensor]:
@@ -246,23 +379,59 @@ class SensorManager:
         """Read all registered sensors"""
         results = {}
         
-        for sensor_id, sensor in self.sensors.items():
+        if len(self.sensors) <= 1:
+            for sensor_id, sensor in self.sensors.items():
+                try:
+                    values = sensor.read_values()
+                    if values:
+                        results[sensor_id] = values
+                except Exception as e:
+                    self.logger.error("Failed to read sensor %s: %s", sensor_id, e)
+            return results
+            
+        # Reads are I/O bound on the sensor wire, so overlap them
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_DEVICES,
+                                            thread_name_prefix='TrustMonitor-Sensors')
+        futures = {sensor_id: self._pool.submit(sensor.read_values)
+                   for sensor_id, sensor in self.sensors.items()}
+        
+        for sensor_id, future in futures.items():
             try:
-                values = sensor.read_values()
+                values = future.result(timeout=self._read_timeout(self.sensors[sensor_id]))
                 if values:
                     results[sensor_id] = values
             except Exception as e:
-                self.logger.error(f"Failed to read sensor {sensor_id}: {e}")
+                self.logger.error("Failed to read sensor %s: %s", sensor_id, e)
                 
         return results
         
+    def _read_timeout(self, sensor: IHALSensor) -> float:
+        """How long to wait for one sensor: its own retry budget plus a margin"""
+        max_read_time = getattr(sensor, 'max_read_time', None)
+        budget = max_read_time() if max_read_time else 0.0
+        return budget + SENSOR_READ_MARGIN
+        
+    def close(self) -> None:
+        """Shut down the read pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        
     def get_sensor_status(self, sensor_id: str) -> Optional[DeviceStatus]:
         """Get sensor status"""
-        sensor = self.get_sensor(sensor_id)
-        return sensor.get_status() if sensor else None
+        sensor = self.sensors.get(sensor_id)
+        return sensor.status if sensor is not None else None
+
+# Global sensor manager, created on first use
+_sensor_manager = None
 
-# Global sensor manager
-sensor_manager = SensorManager()
+def get_sensor_manager() -> SensorManager:
+    """Get global sensor manager instance"""
+    global _sensor_manager
+    if _sensor_manager is None:
+        _sensor_manager = SensorManager()
+    return _sensor_manager
 
 def create_dht11_sensor(device_id: str = "dht11_sensor", config: Dict[str, Any] = None) -> DHT11Sensor:
     """Create and configure DHT11 sensor"""
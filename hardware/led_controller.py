@@ -15,16 +15,24 @@ Features:
 - Hardware abstraction for LED operations
 """
 
-import RPi.GPIO as GPIO
 import time
-import sys
 import os
-from datetime import datetime
 
-# Ensure current directory is in Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+try:
+    import RPi.GPIO as GPIO
+except ImportError:
+    # Only usable with the pigpio backend
+    GPIO = None
+
+try:
+    from .hal_core import get_console_logger
+    from .hal_indicators import PigpioPWM, acquire_pigpio, release_pigpio
+except ImportError:
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_core import get_console_logger
+    from hal_indicators import PigpioPWM, acquire_pigpio, release_pigpio
+
+logger = get_console_logger('TrustMonitor.LedController')
 
 # RGB LED pin definitions (BCM numbering)
 RGB_PINS = {
@@ -40,11 +48,29 @@ PWM_FREQUENCIES = {
     'blue': 5000    # 5KHz - Blue LED frequency
 }
 
+# Duty cycles (red, green, blue) per pure color (0=off, 100=brightest)
+COLOR_DUTIES = {
+    'red': (100, 0, 0),
+    'green': (0, 100, 0),
+    'blue': (0, 0, 100)
+}
+
+# Status line logged for each pure color, built once from COLOR_DUTIES
+COLOR_MESSAGES = {
+    color: f"Setting {color}: " + ', '.join(f"{name}={duty}({'brightest' if duty else 'off'})"
+                                           for name, duty in zip(('red', 'green', 'blue'), duties))
+    for color, duties in COLOR_DUTIES.items()
+}
+
+# PWM backend: 'rpi_gpio' (software PWM) or 'pigpio' (DMA / hardware PWM via pigpiod)
+LED_PWM_BACKEND = os.getenv('LED_PWM_BACKEND', 'rpi_gpio')
+
 # Global PWM objects
 pins = {}
 p_R = None
 p_G = None
 p_B = None
+pi = None  # pigpio connection when the pigpio backend is active
 
 class LEDController:
     """TrustMonitor Hardware LED Controller"""
@@ -53,20 +79,40 @@ class LEDController:
         """Initialize LED controller"""
         self.initialized = False
         self.current_color = None
+        self._duty = [0, 0, 0]  # Last duty written per channel (red, green, blue)
         
     def setup_gpio(self):
         """Setup GPIO and PWM"""
-        global pins, p_R, p_G, p_B
+        global pins, p_R, p_G, p_B, pi
         
         try:
             pins = {'pin_R': RGB_PINS['red'], 'pin_G': RGB_PINS['green'], 'pin_B': RGB_PINS['blue']}
+            
+            if LED_PWM_BACKEND == 'pigpio':
+                pi = acquire_pigpio()
+                if pi is not None:
+                    # Hardware PWM on BCM 12/13/18/19, DMA-timed PWM elsewhere; no PWM threads
+                    p_R = PigpioPWM(pi, pins['pin_R'], PWM_FREQUENCIES['red'])
+                    p_G = PigpioPWM(pi, pins['pin_G'], PWM_FREQUENCIES['green'])
+                    p_B = PigpioPWM(pi, pins['pin_B'], PWM_FREQUENCIES['blue'])
+                    p_R.start(0)
+                    p_G.start(0)
+                    p_B.start(0)
+                    self._duty = [0, 0, 0]
+                    
+                    self.initialized = True
+                    logger.info("LED controller initialization successful (pigpio)")
+                    return
+                logger.warning("WARNING: pigpio daemon not available, falling back to RPi.GPIO")
+                
+            if GPIO is None:
+                raise RuntimeError("RPi.GPIO not available")
+                
             GPIO.setmode(GPIO.BCM)
             GPIO.setwarnings(False)
             
-            # Setup GPIO pins
-            for i in pins:
-                GPIO.setup(pins[i], GPIO.OUT)
-                GPIO.output(pins[i], GPIO.LOW)
+            # Setup GPIO pins as outputs driven low, in one call
+            GPIO.setup(list(pins.values()), GPIO.OUT, initial=GPIO.LOW)
             
             # Initialize PWM (manufacturer specifications)
             p_R = GPIO.PWM(pins['pin_R'], PWM_FREQUENCIES['red'])
@@ -77,17 +123,18 @@ class LEDController:
             p_R.start(0)
             p_G.start(0)
             p_B.start(0)
+            self._duty = [0, 0, 0]
             
             self.initialized = True
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] LED controller initialization successful")
+            logger.info("LED controller initialization successful")
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: LED initialization failed - {e}")
+            logger.error("ERROR: LED initialization failed - %s", e)
             raise
     
     def cleanup_gpio(self):
         """Clean up GPIO resources"""
-        global p_R, p_G, p_B
+        global p_R, p_G, p_B, pi
         
         try:
             if p_R:
@@ -96,79 +143,117 @@ class LEDController:
                 p_G.stop()
             if p_B:
                 p_B.stop()
+            # cleanup_gpio runs again from main()'s finally; don't stop released channels twice
+            p_R = p_G = p_B = None
             
+            if pi is not None:
+                for i in pins:
+                    pi.write(pins[i], 0)
+                release_pigpio()
+                pi = None
+                logger.info("LED resource cleanup completed")
+                return
+                
             GPIO.setmode(GPIO.BCM)
-            for i in pins:
-                GPIO.setup(pins[i], GPIO.OUT)
-                GPIO.output(pins[i], GPIO.LOW)
+            GPIO.setup(list(pins.values()), GPIO.OUT, initial=GPIO.LOW)
             
             GPIO.cleanup()
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] LED resource cleanup completed")
+            logger.info("LED resource cleanup completed")
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: LED resource cleanup failed - {e}")
+            logger.warning("WARNING: LED resource cleanup failed - %s", e)
+    
+    def _apply(self, target):
+        """Write only the channels whose duty cycle differs from the last write"""
+        for channel, (current, duty, pwm) in enumerate(zip(self._duty, target, (p_R, p_G, p_B))):
+            if current != duty:
+                pwm.ChangeDutyCycle(duty)
+                self._duty[channel] = duty
     
     def set_pure_color(self, color):
         """Set pure color - turn off other colors simultaneously"""
-        global p_R, p_G, p_B
-        
         if not self.initialized:
             raise RuntimeError("LED controller not initialized")
         
-        # Turn off all LEDs
-        p_R.ChangeDutyCycle(0)
-        p_G.ChangeDutyCycle(0)
-        p_B.ChangeDutyCycle(0)
-        
-        # Set specified color (0=off, 100=brightest)
-        if color == 'red':
-            p_R.ChangeDutyCycle(100)  # Red brightest
-            self.current_color = 'red'
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Setting red: red=100(brightest), green=0(off), blue=0(off)")
-            
-        elif color == 'green':
-            p_G.ChangeDutyCycle(100)  # Green brightest
-            self.current_color = 'green'
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Setting green: red=0(off), green=100(brightest), blue=0(off)")
-            
-        elif color == 'blue':
-            p_B.ChangeDutyCycle(100)  # Blue brightest
-            self.current_color = 'blue'
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Setting blue: red=0(off), green=0(off), blue=100(brightest)")
-            
-        else:
+        target = COLOR_DUTIES.get(color)
+        if target is None:
             raise ValueError(f"Invalid color: {color}")
+        
+        self._apply(target)
+        self.current_color = color
+        logger.info(COLOR_MESSAGES[color])
     
     def turn_off_all(self):
         """Turn off all LEDs"""
-        global p_R, p_G, p_B
-        
         if not self.initialized:
             return
         
         # Turn off all LEDs
-        p_R.ChangeDutyCycle(0)
-        p_G.ChangeDutyCycle(0)
-        p_B.ChangeDutyCycle(0)
+        self._apply((0, 0, 0))
         
         self.current_color = None
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] All LEDs turned off")
+        logger.info("All LEDs turned off")
+    
+    def _blink_waveform(self, color, times, speed):
+        """Blink through a repeating pigpio waveform so the edges are DMA-timed"""
+        import pigpio
+        
+        target = COLOR_DUTIES.get(color)
+        if target is None:
+            raise ValueError(f"Invalid color: {color}")
+        
+        color_pins = [pin for pin, duty in zip((pins['pin_R'], pins['pin_G'], pins['pin_B']), target) if duty]
+        mask = 0
+        for pin in color_pins:
+            mask |= 1 << pin
+        half_period = int(speed * 1e6)
+        
+        # Waveforms drive the pins as plain outputs, so stop PWM on them first
+        self._apply((0, 0, 0))
+        for pin in color_pins:
+            pi.set_mode(pin, pigpio.OUTPUT)
+        
+        pi.wave_add_new()
+        pi.wave_add_generic([pigpio.pulse(mask, 0, half_period), pigpio.pulse(0, mask, half_period)])
+        wid = pi.wave_create()
+        try:
+            pi.wave_send_repeat(wid)
+            time.sleep(times * 2 * speed)
+        finally:
+            pi.wave_tx_stop()
+            pi.wave_delete(wid)
+            for pin in color_pins:
+                pi.write(pin, 0)
+            self.current_color = None
     
     def blink_color(self, color, times=5, speed=0.5):
         """Blink specified color"""
         if not self.initialized:
             raise RuntimeError("LED controller not initialized")
         
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {color} LED blinking - {times} times, {speed}s interval")
+        logger.info("Starting %s LED blinking - %s times, %ss interval", color, times, speed)
+        
+        if pi is not None:
+            self._blink_waveform(color, times, speed)
+            logger.info("%s LED blinking completed", color)
+            return
+        
+        target = COLOR_DUTIES.get(color)
+        if target is None:
+            raise ValueError(f"Invalid color: {color}")
         
+        # Drive the channels directly so each edge costs no log formatting
+        # unless debug output is enabled
+        off = (0, 0, 0)
         for i in range(times):
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Blink {i+1}/{times}")
-            self.set_pure_color(color)
+            logger.debug("Blink %d/%d", i + 1, times)
+            self._apply(target)
             time.sleep(speed)
-            self.turn_off_all()
+            self._apply(off)
             time.sleep(speed)
         
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {color} LED blinking completed")
+        self.current_color = None
+        logger.info("%s LED blinking completed", color)
 
 def main():
     """Main program - Command line interface"""
@@ -189,7 +274,7 @@ def main():
         controller.setup_gpio()
         
         if args.color:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Setting {args.color} LED - press Ctrl+C to stop")
+            logger.info("Setting %s LED - press Ctrl+C to stop", args.color)
             controller.set_pure_color(args.color)
             
             # Wait for user interrupt
@@ -197,21 +282,21 @@ def main():
                 while True:
                     time.sleep(1)
             except KeyboardInterrupt:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted, turning off LED")
+                logger.info("User interrupted, turning off LED")
                 controller.turn_off_all()
                 
         elif args.blink:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {args.blink} LED blinking")
+            logger.info("Starting %s LED blinking", args.blink)
             controller.blink_color(args.blink, args.times, args.speed)
             
         elif args.off:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Turning off all LEDs")
+            logger.info("Turning off all LEDs")
             controller.turn_off_all()
         else:
             parser.print_help()
             
     except KeyboardInterrupt:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted operation")
+        logger.info("User interrupted operation")
     except Exception as e:
         print(f"ERROR: {e}")
     finally:
@@ -18,67 +18,89 @@ Features:
 import time
 import sys
 import os
-from datetime import datetime
+import signal
+import asyncio
+import functools
+import logging
 from typing import Optional, Tuple
 
-# Module import configuration
-import sys
-import os
+try:
+    from .hal_core import get_console_logger
+    from .led_controller import LEDController
+    from .sensor_reader import SensorReader
+except ImportError:
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_core import get_console_logger
+    from led_controller import LEDController
+    from sensor_reader import SensorReader
 
-# Environment variable for import strategy
-USE_RELATIVE_IMPORT = os.getenv('USE_RELATIVE_IMPORT', 'false').lower() == 'true'
+logger = get_console_logger('TrustMonitor.SensorMonitor')
 
-if USE_RELATIVE_IMPORT:
-    # Use relative import (legacy method)
-    try:
-        from led_controller import LEDController
-        from sensor_reader import SensorReader
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Using relative import")
-    except ImportError as e:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Relative import failed - {e}")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Recommendation: Check hardware module installation")
-        sys.exit(1)
-else:
-    # Use absolute import (recommended method)
-    try:
-        import sys
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        if current_dir not in sys.path:
-            sys.path.insert(0, current_dir)
-        from led_controller import LEDController
-        from sensor_reader import SensorReader
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Using absolute import")
-    except ImportError as e:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Absolute import failed - {e}")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Recommendation: Check hardware module installation")
-        sys.exit(1)
+# Loggers of the legacy monitor stack that follow LOG_LEVEL
+LEGACY_LOGGERS = ('TrustMonitor.SensorMonitor', 'TrustMonitor.SensorReader', 'TrustMonitor.LedController')
+
+# Unchanged-status cycles between info-level status summaries
+STABLE_LOG_TICKS = 60
+
+# LED status per level: normal, warning, error
+STATUS_LEVELS = ('green', 'blue', 'red')
+
+LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARN': logging.WARNING,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR
+}
+
+def _parse_pins(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated board pin list"""
+    return tuple(pin.strip() for pin in value.split(',') if pin.strip())
 
 class SensorConfig:
     """Sensor configuration management"""
     
+    # (environment variable, default, type, attribute)
+    ENV_SPEC = (
+        # Monitoring interval (seconds)
+        ('SENSOR_MONITOR_INTERVAL', '60', int, 'monitor_interval'),
+        # Temperature and humidity thresholds
+        ('TEMP_WARNING', '40.0', float, 'temp_warning'),
+        ('TEMP_ERROR', '45.0', float, 'temp_error'),
+        ('HUMIDITY_WARNING', '70.0', float, 'humidity_warning'),
+        ('HUMIDITY_ERROR', '80.0', float, 'humidity_error'),
+        # DHT11 board pins, comma separated (e.g. D17,D27)
+        ('DHT_PINS', 'D17', _parse_pins, 'dht_pins'),
+        # Sensor retry configuration
+        ('SENSOR_MAX_RETRIES', '3', int, 'sensor_max_retries'),
+        ('SENSOR_RETRY_DELAY', '1.0', float, 'sensor_retry_delay'),
+        # Optional dark gap before an LED color change (seconds, 0 = none)
+        ('LED_TRANSITION_DELAY', '0.0', float, 'led_transition_delay'),
+        # Console verbosity (DEBUG, INFO, WARN, ERROR)
+        ('LOG_LEVEL', 'INFO', str.upper, 'log_level'),
+    )
+    
+    # Fixed attribute layout: one slot per setting
+    __slots__ = tuple(spec[3] for spec in ENV_SPEC)
+    
     def __init__(self):
         self.load_config()
     
     def load_config(self):
         """Load configuration with environment variable priority"""
-        # Monitoring interval (seconds)
-        self.monitor_interval = int(os.getenv('SENSOR_MONITOR_INTERVAL', '60'))
-        
-        # Temperature and humidity thresholds
-        self.temp_warning = float(os.getenv('TEMP_WARNING', '40.0'))
-        self.temp_error = float(os.getenv('TEMP_ERROR', '45.0'))
-        self.humidity_warning = float(os.getenv('HUMIDITY_WARNING', '70.0'))
-        self.humidity_error = float(os.getenv('HUMIDITY_ERROR', '80.0'))
+        env = os.environ
+        for name, default, convert, attr in self.ENV_SPEC:
+            setattr(self, attr, convert(env.get(name, default)))
         
-        # Sensor retry configuration
-        self.sensor_max_retries = int(os.getenv('SENSOR_MAX_RETRIES', '3'))
-        self.sensor_retry_delay = float(os.getenv('SENSOR_RETRY_DELAY', '1.0'))
+        level = LOG_LEVELS.get(self.log_level, logging.INFO)
+        for name in LEGACY_LOGGERS:
+            logging.getLogger(name).setLevel(level)
         
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Configuration loaded successfully")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Monitoring interval: {self.monitor_interval} seconds")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Temperature thresholds: warning {self.temp_warning}°C, error {self.temp_error}°C")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Humidity thresholds: warning {self.humidity_warning}%, error {self.humidity_error}%")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor retry settings: max {self.sensor_max_retries} retries, delay {self.sensor_retry_delay} seconds")
+        logger.info("Configuration loaded successfully")
+        logger.info("Monitoring interval: %s seconds", self.monitor_interval)
+        logger.info("Temperature thresholds: warning %s°C, error %s°C", self.temp_warning, self.temp_error)
+        logger.info("Humidity thresholds: warning %s%%, error %s%%", self.humidity_warning, self.humidity_error)
+        logger.info("Sensor retry settings: max %s retries, delay %s seconds", self.sensor_max_retries, self.sensor_retry_delay)
 
 class SensorMonitor:
     """TrustMonitor sensor monitoring service"""
@@ -87,8 +109,12 @@ class SensorMonitor:
         """Initialize sensor monitor"""
         self.config = SensorConfig()
         self.led_controller = LEDController()
-        self.sensor_reader = SensorReader()
+        self.sensor_readers = [SensorReader(pin) for pin in self.config.dht_pins]
         self.current_status = None
+        self._loop = None  # Event loop running run_continuous
+        self._stop = None  # asyncio.Event set to end run_continuous between cycles
+        self._io_lock = None  # Serializes sensor access from the executor
+        self._same_status_count = 0  # Consecutive cycles without a status change
         
     def initialize(self):
         """Initialize hardware components"""
@@ -97,84 +123,88 @@ class SensorMonitor:
             self.led_controller.setup_gpio()
             
             # Initialize sensor
-            self.sensor_reader.initialize_sensor()
+            for reader in self.sensor_readers:
+                reader.initialize_sensor()
             
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor monitor initialization completed")
+            logger.info("Sensor monitor initialization completed")
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Sensor monitor initialization failed - {e}")
+            logger.error("ERROR: Sensor monitor initialization failed - %s", e)
             raise
     
     def determine_status(self, temperature: float, humidity: float) -> str:
         """Determine LED status based on temperature and humidity"""
-        # Check error thresholds
-        if temperature >= self.config.temp_error or humidity >= self.config.humidity_error:
-            return 'red'
+        config = self.config
+        errored = (temperature >= config.temp_error) | (humidity >= config.humidity_error)
+        warned = (temperature >= config.temp_warning) | (humidity >= config.humidity_warning)
         
-        # Check warning thresholds
-        if temperature >= self.config.temp_warning or humidity >= self.config.humidity_warning:
-            return 'blue'
-        
-        # Normal status
-        return 'green'
+        # Error outranks warning: 2 if errored, else 1 if warned, else 0
+        return STATUS_LEVELS[max(2 * errored, warned)]
     
-    def update_led_status(self, status: str):
+    async def update_led_status(self, status: str):
         """Update LED status"""
-        if status != self.current_status:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Status changed: {self.current_status} -> {status}")
-            
-            # Turn off all LEDs first
+        if status == self.current_status:
+            return
+        
+        logger.info("Status changed: %s -> %s", self.current_status, status)
+        
+        if self.config.led_transition_delay > 0:
             self.led_controller.turn_off_all()
-            
-            # Wait to ensure LEDs are off
-            time.sleep(0.5)
-            
-            # Set new status
-            self.led_controller.set_pure_color(status)
-            
-            self.current_status = status
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] LED {status} set successfully")
+            await asyncio.sleep(self.config.led_transition_delay)
+        
+        # Set new status; only the channels that change are rewritten
+        self.led_controller.set_pure_color(status)
+        
+        self.current_status = status
+        logger.info("LED %s set successfully", status)
     
-    def read_sensors(self) -> Optional[Tuple[float, float]]:
+    async def read_sensors(self) -> Optional[Tuple[float, float]]:
         """Read temperature and humidity"""
         try:
-            # Read temperature
-            temperature = self.sensor_reader.read_sensor_with_retry(
-                'temperature', 
-                self.config.sensor_max_retries, 
-                self.config.sensor_retry_delay
-            )
+            if self._io_lock is None:
+                self._io_lock = asyncio.Lock()
             
-            if temperature is None:
-                return None
-            
-            # Wait before reading humidity
-            time.sleep(2)
-            
-            # Read humidity
-            humidity = self.sensor_reader.read_sensor_with_retry(
-                'humidity', 
-                self.config.sensor_max_retries, 
-                self.config.sensor_retry_delay
+            # Read temperature and humidity in one transaction per sensor; retries
+            # may use at most half the monitor interval so the cadence holds.
+            # The blocking DHT reads run in worker threads.
+            deadline = time.monotonic() + self.config.monitor_interval * 0.5
+            loop = asyncio.get_running_loop()
+            read = functools.partial(
+                SensorReader.read_both_with_deadline,
+                deadline=deadline,
+                max_retries=self.config.sensor_max_retries, 
+                retry_delay=self.config.sensor_retry_delay
             )
+            async with self._io_lock:
+                if len(self.sensor_readers) > 1 and all(reader.use_pulseio for reader in self.sensor_readers):
+                    # pulseio capture doesn't hold the GIL, so the sensors can be read in parallel
+                    results = await asyncio.gather(
+                        *(loop.run_in_executor(None, read, reader) for reader in self.sensor_readers)
+                    )
+                else:
+                    # Bit-banged reads are timing-critical; never overlap them
+                    results = [await loop.run_in_executor(None, read, reader) for reader in self.sensor_readers]
             
-            if humidity is None:
+            # Any failed sensor fails the cycle; otherwise report the worst readings
+            if None in results:
                 return None
-            
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor read successful: temperature {temperature:.1f}°C, humidity {humidity:.1f}%")
+            temperature = max(values[0] for values in results)
+            humidity = max(values[1] for values in results)
+            # Kept at info: daemon/health_monitor.sh greps --test output for this line
+            logger.info("Sensor read successful: temperature %.1f°C, humidity %.1f%%", temperature, humidity)
             return temperature, humidity
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Sensor read failed - {e}")
+            logger.error("ERROR: Sensor read failed - %s", e)
             return None
     
-    def run_once(self):
+    async def run_once(self):
         """Execute one monitoring cycle"""
         try:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting sensor reading (max retries: {self.config.sensor_max_retries} times)")
+            logger.debug("Starting sensor reading (max retries: %s times)", self.config.sensor_max_retries)
             
             # Read sensors
-            result = self.read_sensors()
+            result = await self.read_sensors()
             
             if result is not None:
                 temperature, humidity = result
@@ -182,42 +212,89 @@ class SensorMonitor:
                 # Determine status
                 status = self.determine_status(temperature, humidity)
                 
+                if status == self.current_status:
+                    # Steady state: no LED work, and only a periodic summary at info
+                    self._same_status_count += 1
+                    if self._same_status_count % STABLE_LOG_TICKS == 0:
+                        logger.info("Temperature: %.1f°C, Humidity: %.1f%%, Status: %s (stable for %d cycles)", 
+                                    temperature, humidity, status, self._same_status_count)
+                    else:
+                        logger.debug("Temperature: %.1f°C, Humidity: %.1f%%, Status: %s", temperature, humidity, status)
+                    return
+                
                 # Update LED status
-                self.update_led_status(status)
+                self._same_status_count = 0
+                await self.update_led_status(status)
                 
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Temperature: {temperature:.1f}°C, Humidity: {humidity:.1f}%, Status: {status}")
+                logger.info("Temperature: %.1f°C, Humidity: %.1f%%, Status: %s", temperature, humidity, status)
             else:
                 # Sensor failed, turn on red LED
-                self.update_led_status('red')
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor read failed, status: {self.current_status}")
+                self._same_status_count = 0
+                await self.update_led_status('red')
+                logger.info("Sensor read failed, status: %s", self.current_status)
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Monitoring execution failed - {e}")
+            logger.error("ERROR: Monitoring execution failed - %s", e)
     
-    def run_continuous(self):
+    async def run_continuous(self):
         """Continuous monitoring"""
         try:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting continuous monitoring, interval: {self.config.monitor_interval} seconds")
+            logger.info("Starting continuous monitoring, interval: %s seconds", self.config.monitor_interval)
             
-            while True:
-                self.run_once()
-                time.sleep(self.config.monitor_interval)
+            loop = asyncio.get_running_loop()
+            self._stop = asyncio.Event()
+            # Let SIGTERM wake the wait below directly instead of going through stop()
+            previous_handler = signal.getsignal(signal.SIGTERM)
+            loop.add_signal_handler(signal.SIGTERM, self._stop.set)
+            self._loop = loop
+            
+            # Fixed-phase schedule: the time run_once takes doesn't push later cycles back
+            next_time = loop.time()
+            while not self._stop.is_set():
+                await self.run_once()
+                next_time += self.config.monitor_interval
+                delay = next_time - loop.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._stop.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    # Overran the interval; restart the schedule rather than bursting to catch up
+                    logger.warning("WARNING: Monitoring cycle overran the %s second interval by %.1f seconds, resynchronizing", 
+                                   self.config.monitor_interval, -delay)
+                    next_time = loop.time()
                 
         except KeyboardInterrupt:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted monitoring")
+            logger.info("User interrupted monitoring")
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Continuous monitoring failed - {e}")
+            logger.error("ERROR: Continuous monitoring failed - %s", e)
         finally:
+            if self._loop is not None:
+                # remove_signal_handler resets SIGTERM to SIG_DFL; put main()'s handler back
+                self._loop.remove_signal_handler(signal.SIGTERM)
+                signal.signal(signal.SIGTERM, previous_handler)
+                self._loop = None
             self.cleanup()
     
+    def stop(self):
+        """Ask run_continuous to return; safe to call from a signal handler
+        
+        Outside run_continuous (initialization, --test) there is no cycle to
+        finish, so this raises SystemExit and lets the caller's cleanup run.
+        """
+        if self._loop is None:
+            raise SystemExit(0)
+        self._loop.call_soon_threadsafe(self._stop.set)
+    
     def cleanup(self):
         """Clean up resources"""
         try:
             if hasattr(self.led_controller, 'cleanup_gpio'):
                 self.led_controller.cleanup_gpio()
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor monitor cleanup completed")
+            logger.info("Sensor monitor cleanup completed")
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Cleanup failed - {e}")
+            logger.warning("WARNING: Cleanup failed - %s", e)
 
 def print_usage():
     """Display usage instructions"""
@@ -235,8 +312,12 @@ def print_usage():
     print("  TEMP_ERROR             Temperature error threshold (°C, default 45.0)")
     print("  HUMIDITY_WARNING       Humidity warning threshold (%), default 70.0)")
     print("  HUMIDITY_ERROR         Humidity error threshold (%), default 80.0)")
+    print("  DHT_PINS               DHT11 board pins, comma separated (default D17)")
     print("  SENSOR_MAX_RETRIES     Sensor max retry count (default 3)")
     print("  SENSOR_RETRY_DELAY     Sensor retry delay (seconds, default 1.0)")
+    print("  SENSOR_CACHE_TTL       Reuse a good reading for this long (seconds, default 5)")
+    print("  LED_TRANSITION_DELAY   Dark gap before an LED color change (seconds, default 0.0)")
+    print("  LOG_LEVEL              Console log level (DEBUG, INFO, WARN, ERROR; default INFO)")
     print()
     sys.exit(0)
 
@@ -249,23 +330,26 @@ def main():
     # Create sensor monitor
     monitor = SensorMonitor()
     
+    # Exit cleanly on service shutdown, including during initialization and --test
+    signal.signal(signal.SIGTERM, lambda signum, frame: monitor.stop())
+    
     try:
         # Initialize hardware
         monitor.initialize()
         
         # Execute one test
         if len(sys.argv) > 1 and sys.argv[1] in ['--test', '-t']:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Executing one test...")
-            monitor.run_once()
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test completed")
+            logger.info("Executing one test...")
+            asyncio.run(monitor.run_once())
+            logger.info("Test completed")
         else:
             # Continuous monitoring
-            monitor.run_continuous()
+            asyncio.run(monitor.run_continuous())
             
     except KeyboardInterrupt:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] User interrupted monitoring")
+        logger.info("User interrupted monitoring")
     except Exception as e:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {e}")
+        logger.error("ERROR: %s", e)
         sys.exit(1)
     finally:
         monitor.cleanup()
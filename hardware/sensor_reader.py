@@ -5,65 +5,99 @@ TrustMonitor Hardware Sensor Reading Module
 
 Features:
 - DHT11 temperature and humidity sensor data reading
+- Paired temperature/humidity reading from a single DHT transaction
 - Support for separate temperature and humidity reading
 - Professional error handling and logging
 - Integration with TrustMonitor health monitoring system
 - Hardware abstraction for sensor operations
 """
 
-import board
-import adafruit_dht
 import time
-import sys
 import os
-from datetime import datetime
 
-# Ensure current directory is in Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+try:
+    from .hal_core import get_console_logger
+except ImportError:
+    # Loaded as a top-level module (scripts executed from hardware/)
+    from hal_core import get_console_logger
+
+logger = get_console_logger('TrustMonitor.SensorReader')
+
+# Capture DHT11 pulses through pulseio (needs libgpiod); 'false' forces bit-banging
+DHT_USE_PULSEIO = os.getenv('DHT_USE_PULSEIO', 'true').lower() == 'true'
+
+# Backoff between read attempts: retry_delay * RETRY_BACKOFF**attempt, clamped (seconds).
+# adafruit_dht ignores measure() calls within 2 s of the previous one and returns
+# the old frame, so no retry may come sooner than that.
+RETRY_BACKOFF = 1.5
+MIN_RETRY_DELAY = 2.1
+MAX_RETRY_DELAY = 4.0
+
+def _retry_delay(retry_delay, attempt):
+    """Delay after the given failed attempt (0-based)"""
+    return min(max(retry_delay * (RETRY_BACKOFF ** attempt), MIN_RETRY_DELAY), MAX_RETRY_DELAY)
 
 class SensorReader:
     """TrustMonitor Hardware Sensor Reader"""
     
-    def __init__(self):
-        """Initialize sensor reader"""
+    def __init__(self, pin='D17'):
+        """Initialize sensor reader for the DHT11 on the given board pin name"""
         self.dht = None
         self.initialized = False
         self.sensor_type = "DHT11"
-        self.sensor_pin = "GPIO17"
+        self.sensor_pin = pin
+        self.use_pulseio = False  # True once the DHT is read through pulseio
+        # Last good (monotonic time, temperature, humidity) from read_both
+        self._cache = (float('-inf'), None, None)
+        self.cache_ttl = float(os.getenv('SENSOR_CACHE_TTL', '5'))
         
     def initialize_sensor(self):
         """Initialize DHT11 sensor"""
         try:
-            self.dht = adafruit_dht.DHT11(board.D17, use_pulseio=False)
+            # Imported here: board probes the platform on import, which --help
+            # and config-only paths don't need
+            import board
+            import adafruit_dht
+            
+            pin = getattr(board, self.sensor_pin)
+            self.dht = None
+            self.use_pulseio = False
+            if DHT_USE_PULSEIO:
+                # Kernel-side edge capture (libgpiod_pulsein) instead of a Python busy loop
+                try:
+                    self.dht = adafruit_dht.DHT11(pin, use_pulseio=True)
+                    self.use_pulseio = True
+                except Exception as e:
+                    logger.warning("WARNING: pulseio DHT read unavailable, using bit-banging - %s", e)
+            if self.dht is None:
+                self.dht = adafruit_dht.DHT11(pin, use_pulseio=False)
             self.initialized = True
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor initialization successful")
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sensor type: {self.sensor_type}")
+            logger.info("Sensor initialization successful")
+            logger.info("Sensor type: %s on %s", self.sensor_type, self.sensor_pin)
             
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Sensor initialization failed - {e}")
+            logger.error("ERROR: Sensor initialization failed - %s", e)
             raise
     
     def read_temperature(self):
-        """讀取溫度"""
+        """Read temperature"""
         if not self.initialized:
             raise RuntimeError("Sensor not initialized")
         
         try:
             temperature = self.dht.temperature
             if temperature is not None:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Temperature read successful: {temperature:.1f}°C")
+                logger.debug("Temperature read successful: %.1f°C", temperature)
                 return temperature
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Temperature read failed - sensor returned None")
+                logger.error("ERROR: Temperature read failed - sensor returned None")
                 return None
                 
         except RuntimeError as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Temperature read failed - {e}")
+            logger.error("ERROR: Temperature read failed - %s", e)
             return None
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Temperature sensor error - {e}")
+            logger.error("ERROR: Temperature sensor error - %s", e)
             return None
     
     def read_humidity(self):
@@ -74,41 +108,100 @@ class SensorReader:
         try:
             humidity = self.dht.humidity
             if humidity is not None:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Humidity read successful: {humidity:.1f}%")
+                logger.debug("Humidity read successful: %.1f%%", humidity)
                 return humidity
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Humidity read failed - sensor returned None")
+                logger.error("ERROR: Humidity read failed - sensor returned None")
                 return None
                 
         except RuntimeError as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Humidity read failed - {e}")
+            logger.error("ERROR: Humidity read failed - %s", e)
             return None
         except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Humidity sensor error - {e}")
+            logger.error("ERROR: Humidity sensor error - %s", e)
             return None
     
+    def invalidate_cache(self):
+        """Force the next read_both call to sample the sensor"""
+        self._cache = (float('-inf'), None, None)
+    
+    def read_both(self):
+        """Read temperature and humidity from a single DHT transaction"""
+        if not self.initialized:
+            raise RuntimeError("Sensor not initialized")
+        
+        cached_at, temperature, humidity = self._cache
+        if time.monotonic() - cached_at < self.cache_ttl:
+            logger.debug("Using cached reading: %.1f°C, %.1f%%", temperature, humidity)
+            return temperature, humidity
+        
+        try:
+            # One transaction for both channels; the property reads below
+            # return the values decoded from this frame
+            self.dht.measure()
+            temperature = self.dht.temperature
+            humidity = self.dht.humidity
+            if temperature is not None and humidity is not None:
+                logger.debug("Sensor read successful: %.1f°C, %.1f%%", temperature, humidity)
+                self._cache = (time.monotonic(), temperature, humidity)
+                return temperature, humidity
+            else:
+                # Transient; read_both_with_deadline logs once if every attempt fails
+                logger.debug("Sensor read attempt failed - sensor returned None")
+                return None
+                
+        except RuntimeError as e:
+            logger.debug("Sensor read attempt failed - %s", e)
+            return None
+        except Exception as e:
+            logger.debug("Sensor read attempt failed - unexpected error: %s", e)
+            return None
+    
+    def read_both_with_deadline(self, deadline, max_retries=3, retry_delay=2):
+        """Read temperature and humidity, retrying until time.monotonic() reaches deadline"""
+        logger.debug("Starting temperature/humidity read (max retries: %s)", max_retries)
+        
+        for attempt in range(max_retries):
+            logger.debug("Attempt %s/%s", attempt + 1, max_retries)
+            
+            values = self.read_both()
+            if values is not None:
+                return values
+            
+            # Only sleep if another attempt still fits before the deadline
+            delay = _retry_delay(retry_delay, attempt)
+            remaining = deadline - time.monotonic()
+            if attempt == max_retries - 1 or remaining <= delay:
+                break
+            logger.debug("Waiting %s seconds before retry...", delay)
+            time.sleep(delay)
+        
+        logger.error("ERROR: temperature/humidity read failed - retries or time budget exhausted")
+        return None
+    
     def read_sensor_with_retry(self, sensor_type, max_retries=3, retry_delay=2):
         """Read sensor values with retry mechanism"""
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {sensor_type} read (max retries: {max_retries})")
+        logger.debug("Starting %s read (max retries: %s)", sensor_type, max_retries)
         
         for attempt in range(max_retries):
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Attempt {attempt + 1}/{max_retries}")
+            logger.debug("Attempt %s/%s", attempt + 1, max_retries)
             
             if sensor_type == "temperature":
                 value = self.read_temperature()
             elif sensor_type == "humidity":
                 value = self.read_humidity()
             else:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Unsupported sensor type - {sensor_type}")
+                logger.error("ERROR: Unsupported sensor type - %s", sensor_type)
                 return None
             
             if value is not None:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {sensor_type} read successful")
+                logger.debug("%s read successful", sensor_type)
                 return value
             
             if attempt < max_retries - 1:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Waiting {retry_delay} seconds before retry...")
-                time.sleep(retry_delay)
+                delay = _retry_delay(retry_delay, attempt)
+                logger.debug("Waiting %s seconds before retry...", delay)
+                time.sleep(delay)
         
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: {sensor_type} read failed - max retries reached")
+        logger.error("ERROR: %s read failed - max retries reached", sensor_type)
         return None
\ No newline at end of file
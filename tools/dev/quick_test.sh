@@ -57,6 +57,28 @@ else
     echo "❌ CPU monitoring failed"
 fi
 
+# Test 6: HAL LED state handling (simulation only, no GPIO is touched)
+echo "🔍 Checking HAL LED state handling..."
+if python3 - "$PROJECT_ROOT/hardware" >/dev/null 2>&1 <<'EOF'
+import sys
+sys.path.insert(0, sys.argv[1])
+from hal_core import DeviceStatus
+from hal_indicators import RGBLEDIndicator, LEDColor, LEDState
+
+# Never initialized, so set_state stays on the simulation path
+led = RGBLEDIndicator('quick_test_led')
+led.status = DeviceStatus.READY
+# Enum members and strings are both accepted; anything else is rejected
+assert led.set_state(LEDState.ON, color=LEDColor.RED) and led.current_color is LEDColor.RED
+assert led.set_state('on', color='blue') and led.current_color is LEDColor.BLUE
+assert not led.set_state('on', color=3)
+EOF
+then
+    echo "✅ HAL LED state handling works"
+else
+    echo "❌ HAL LED state handling failed"
+fi
+
 echo ""
 echo "=== Quick Test Completed ==="
 echo "For detailed testing, run: bash tools/user/demo.sh"